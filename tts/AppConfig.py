@@ -25,30 +25,91 @@ class AppConfig:
         # Get project root directory
         self.project_root = self._get_project_root()
         
-        # Google Cloud credentials
-        self.google_credentials: str = self._get_env('GOOGLE_APPLICATION_CREDENTIALS')
+        # TTS backend: 'google' or 'offline' (no network, for load testing)
+        self.tts_backend: str = self._get_env('TTS_BACKEND', 'google').lower()
+
+        # Google Cloud credentials, only required by the Google backend
+        self.google_credentials: str = self._get_env(
+            'GOOGLE_APPLICATION_CREDENTIALS',
+            None if self.tts_backend == 'google' else ''
+        )
         
         # TTS Configuration
         self.default_language: str = self._get_env('DEFAULT_LANGUAGE', 'English')
         self.translation_language: str = self._get_env('TRANSLATION_LANGUAGE', 'English')
         self.activate_translation: bool = self._get_env('ACTIVATE_TRANSLATION', 'false').lower() == 'true'
         self.default_speaker: str = self._get_env('DEFAULT_SPEAKER', 'neutral')
+
+        # TTS Client Configuration
+        self.tts_client_pool_size: int = int(self._get_env('TTS_CLIENT_POOL_SIZE', '4'))
+        self.tts_client_health_check_interval: float = float(self._get_env('TTS_CLIENT_HEALTH_CHECK_INTERVAL', '300'))
+        self.tts_client_max_failures: int = int(self._get_env('TTS_CLIENT_MAX_FAILURES', '2'))
+        self.tts_max_concurrency: int = int(self._get_env('TTS_MAX_CONCURRENCY', '8'))
+        self.tts_max_input_bytes: int = int(self._get_env('TTS_MAX_INPUT_BYTES', '4500'))
+
+        # TTS Retry Configuration
+        self.tts_request_timeout: float = float(self._get_env('TTS_REQUEST_TIMEOUT', '30'))
+        self.tts_retry_max_attempts: int = int(self._get_env('TTS_RETRY_MAX_ATTEMPTS', '4'))
+        self.tts_retry_base_delay: float = float(self._get_env('TTS_RETRY_BASE_DELAY', '0.5'))
+        self.tts_retry_max_delay: float = float(self._get_env('TTS_RETRY_MAX_DELAY', '10'))
+        self.tts_hedge_enabled: bool = self._get_env('TTS_HEDGE_ENABLED', 'false').lower() == 'true'
+        self.tts_hedge_percentile: float = float(self._get_env('TTS_HEDGE_PERCENTILE', '95'))
+        self.tts_hedge_min_samples: int = int(self._get_env('TTS_HEDGE_MIN_SAMPLES', '20'))
+
+        # TTS SSML Batching Configuration
+        # Short items sharing a voice are sent as one SSML request and split at <mark> timepoints
+        self.tts_ssml_batching: bool = self._get_env('TTS_SSML_BATCHING', 'false').lower() == 'true'
+        self.tts_ssml_batch_size: int = int(self._get_env('TTS_SSML_BATCH_SIZE', '8'))
+        self.tts_ssml_batch_max_chars: int = int(self._get_env('TTS_SSML_BATCH_MAX_CHARS', '200'))
+        self.tts_ssml_batch_break_ms: int = int(self._get_env('TTS_SSML_BATCH_BREAK_MS', '300'))
+
+        # TTS Time-Stretch Configuration
+        # Synthesize every item at the base rate and derive other speaking rates locally,
+        # so renditions at several rates share one paid (and cached) synthesis
+        self.tts_time_stretch_enabled: bool = self._get_env('TTS_TIME_STRETCH_ENABLED', 'false').lower() == 'true'
+        self.tts_time_stretch_base_rate: float = float(self._get_env('TTS_TIME_STRETCH_BASE_RATE', '1.0'))
+
+        # Offline TTS Configuration
+        self.offline_tts_chars_per_second: float = float(self._get_env('OFFLINE_TTS_CHARS_PER_SECOND', '15'))
+        self.offline_tts_latency_ms: int = int(self._get_env('OFFLINE_TTS_LATENCY_MS', '0'))
+        self.offline_tts_error_rate: float = float(self._get_env('OFFLINE_TTS_ERROR_RATE', '0'))
+        self.offline_tts_seed: int = int(self._get_env('OFFLINE_TTS_SEED', '0'))
         
         # Audio Configuration
-        self.audio_format: str = self._get_env('AUDIO_FORMAT', 'mp3')
+        # Lossless mode: TTS returns LINEAR16 PCM, segments and intermediate merges keep PCM audio,
+        # and audio is encoded to the merged codec only once, in the final merged video
+        self.lossless_intermediate_audio: bool = self._get_env('LOSSLESS_INTERMEDIATE_AUDIO', 'false').lower() == 'true'
+        self.tts_audio_encoding: str = 'LINEAR16' if self.lossless_intermediate_audio else 'MP3'
+        self.audio_format: str = self._get_env('AUDIO_FORMAT', 'wav' if self.lossless_intermediate_audio else 'mp3')
         self.audio_quality: str = self._get_env('AUDIO_QUALITY', 'high')
-        self.text_to_audio_codec: str = self._get_env('TEXT_TO_AUDIO_CODEC', 'aac')
+        self.text_to_audio_codec: str = self._get_env('TEXT_TO_AUDIO_CODEC', 'pcm_s16le' if self.lossless_intermediate_audio else 'aac')
         self.merged_audio_codec: str = self._get_env('MERGED_AUDIO_CODEC', 'aac')
+        self.intermediate_audio_codec: str = 'pcm_s16le' if self.lossless_intermediate_audio else self.merged_audio_codec
         
         # Video Configuration
-        self.video_format: str = self._get_env('VIDEO_FORMAT', 'mp4')
+        # MP4 cannot carry PCM audio, so lossless segments and intermediate merges use Matroska
+        self.video_format: str = self._get_env('VIDEO_FORMAT', 'mkv' if self.lossless_intermediate_audio else 'mp4')
+        self.intermediate_video_format: str = 'mkv' if self.lossless_intermediate_audio else 'mp4'
         self.video_fps: int = int(self._get_env('VIDEO_FPS', '30'))
         self.merged_video_fps: int = int(self._get_env('MERGED_VIDEO_FPS', '30'))
         self.image_to_video_codec: str = self._get_env('IMAGE_TO_VIDEO_CODEC', 'libx264')
         self.merged_video_codec: str = self._get_env('MERGED_VIDEO_CODEC', 'libx264')
+        # Encode each segment's still slide with one ffmpeg run (image decoded once, still-image tuning,
+        # long GOP) instead of pushing every frame through moviepy; moviepy remains the fallback.
+        # A STILL_IMAGE_FPS below VIDEO_FPS makes segments cheaper still
+        self.still_image_encoding: bool = self._get_env('STILL_IMAGE_ENCODING', 'true').lower() == 'true'
+        self.still_image_fps: int = int(self._get_env('STILL_IMAGE_FPS', str(self.video_fps)))
+        self.still_image_gop_seconds: float = float(self._get_env('STILL_IMAGE_GOP_SECONDS', '10'))
+        self.still_image_preset: str = self._get_env('STILL_IMAGE_PRESET', 'veryfast')
+        self.ffmpeg_binary: str = self._get_env('FFMPEG_BINARY', 'ffmpeg')
+        self.ffprobe_binary: str = self._get_env('FFPROBE_BINARY', 'ffprobe')
+        self.ffmpeg_timeout: float = float(self._get_env('FFMPEG_TIMEOUT', '300'))
         self.video_batch_size: int = int(self._get_env('VIDEO_BATCH_SIZE', '6'))
         self.use_v2_merge: bool = self._get_env('USE_V2_MERGE', 'false').lower() == 'true'
         self.use_v2_merge_all: bool = self._get_env('USE_V2_MERGE_ALL', 'false').lower() == 'true'
+        # Merge videos whose streams match with the ffmpeg concat demuxer, copying the streams
+        # instead of re-encoding; mismatched or failed merges fall back to the moviepy merge
+        self.merge_stream_copy: bool = self._get_env('MERGE_STREAM_COPY', 'true').lower() == 'true'
         
         # Background Music Configuration
         self.enable_background_music: bool = self._get_env('ENABLE_BACKGROUND_MUSIC', 'false').lower() == 'true'
@@ -61,8 +122,58 @@ class AppConfig:
         self.conversations_background: str = self._get_env('CONVERSATIONS_BACKGROUND', os.path.join(self.project_root, 'data', 'background.jpg'))
         self.new_words_background: str = self._get_env('NEW_WORDS_BACKGROUND', os.path.join(self.project_root, 'data', 'background.jpg'))
 
+        # TTS Cache Configuration
+        self.tts_cache_enabled: bool = self._get_env('TTS_CACHE_ENABLED', 'true').lower() == 'true'
+        self.tts_cache_dir: str = self._get_env('TTS_CACHE_DIR', os.path.join(self.temp_dir, 'tts_cache'))
+        self.tts_cache_max_bytes: int = int(self._get_env('TTS_CACHE_MAX_BYTES', str(512 * 1024 * 1024)))
+        # Fleet-wide second tier in MongoDB GridFS, shared by every render host
+        self.tts_shared_cache_enabled: bool = self._get_env('TTS_SHARED_CACHE_ENABLED', 'false').lower() == 'true'
+        self.tts_shared_cache_bucket: str = self._get_env('TTS_SHARED_CACHE_BUCKET', 'tts_audio_cache')
+
+        # Slide Image Cache Configuration
+        # Rendered slide PNGs keyed by slide text, background, logo and style settings
+        self.slide_image_cache_enabled: bool = self._get_env('SLIDE_IMAGE_CACHE_ENABLED', 'true').lower() == 'true'
+        self.slide_image_cache_dir: str = self._get_env('SLIDE_IMAGE_CACHE_DIR', os.path.join(self.temp_dir, 'slide_cache'))
+        self.slide_image_cache_max_bytes: int = int(self._get_env('SLIDE_IMAGE_CACHE_MAX_BYTES', str(1024 * 1024 * 1024)))
+
+        # TTS Rate Limit Configuration
+        # Token bucket shared by every process: 'file' on one host, 'mongodb' across hosts, 'none' to disable
+        self.tts_rate_limit_backend: str = self._get_env('TTS_RATE_LIMIT_BACKEND', 'none').lower()
+        self.tts_rate_limit_per_minute: float = float(self._get_env('TTS_RATE_LIMIT_PER_MINUTE', '900'))
+        self.tts_rate_limit_burst: int = int(self._get_env('TTS_RATE_LIMIT_BURST', '20'))
+        self.tts_rate_limit_file: str = self._get_env('TTS_RATE_LIMIT_FILE', os.path.join(self.temp_dir, 'tts_rate_limit.json'))
+        self.tts_rate_limit_name: str = self._get_env('TTS_RATE_LIMIT_NAME', 'google-tts')
+        # Server selection timeout of the 'mongodb' limiter, short so an outage fails open quickly
+        self.tts_rate_limit_mongodb_timeout_ms: int = int(self._get_env('TTS_RATE_LIMIT_MONGODB_TIMEOUT_MS', '2000'))
+
+        # Voice Catalog Configuration
+        self.voice_validation_enabled: bool = self._get_env('VOICE_VALIDATION_ENABLED', 'true').lower() == 'true'
+        self.voice_catalog_file: str = self._get_env('VOICE_CATALOG_FILE', os.path.join(self.temp_dir, 'voice_catalog.json'))
+        self.voice_catalog_ttl: float = float(self._get_env('VOICE_CATALOG_TTL', str(7 * 24 * 3600)))
+        # Bundled voice list used when there is no snapshot and the service cannot be reached
+        self.voice_catalog_seed_file: str = self._get_env('VOICE_CATALOG_SEED_FILE', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'google_tts_voice_list.json'))
+
         # Slide Generation Configuration
         self.slide_generation_mode_pdf: bool = self._get_env('SLIDE_GENERATION_MODE_PDF', 'false').lower() == 'true'
+        # 'pptx' builds PowerPoint slides converted by LibreOffice, 'raster' draws PNG slides directly
+        self.slide_renderer: str = self._get_env('SLIDE_RENDERER', 'pptx').lower()
+        self.slide_raster_font_file: str = self._get_env('SLIDE_RASTER_FONT_FILE', '')
+        self.slide_logo_file: str = self._get_env('SLIDE_LOGO_FILE', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logo', 'logo-nobg-2.png'))
+        # PDF pages are rasterized straight at the video size times this factor, then downscaled
+        self.slide_raster_supersample: int = max(1, int(self._get_env('SLIDE_RASTER_SUPERSAMPLE', '1')))
+        # Backgrounds are scaled to the slide size and re-encoded once, cached by source digest
+        self.slide_background_normalize: bool = self._get_env('SLIDE_BACKGROUND_NORMALIZE', 'true').lower() == 'true'
+        self.slide_background_dir: str = self._get_env('SLIDE_BACKGROUND_DIR', os.path.join(self.temp_dir, 'backgrounds'))
+        self.slide_background_jpeg_quality: int = int(self._get_env('SLIDE_BACKGROUND_JPEG_QUALITY', '90'))
+        # Build one deck per section, converted with one PDF export and one pdftoppm pass
+        self.slide_batch_conversion: bool = self._get_env('SLIDE_BATCH_CONVERSION', 'false').lower() == 'true'
+        # Keep one headless LibreOffice running (needs the UNO bridge) instead of starting soffice per slide
+        self.libreoffice_persistent: bool = self._get_env('LIBREOFFICE_PERSISTENT', 'true').lower() == 'true'
+        self.libreoffice_binary: str = self._get_env('LIBREOFFICE_BINARY', 'soffice')
+        self.libreoffice_convert_timeout: float = float(self._get_env('LIBREOFFICE_CONVERT_TIMEOUT', '60'))
+        self.libreoffice_startup_timeout: float = float(self._get_env('LIBREOFFICE_STARTUP_TIMEOUT', '30'))
+        # One-shot soffice runs converting slides at once, each with its own profile and output directory
+        self.slide_conversion_workers: int = max(1, int(self._get_env('SLIDE_CONVERSION_WORKERS', '1')))
         self.slide_title_font_size: int = int(self._get_env('SLIDE_TITLE_FONT_SIZE', '26'))
         self.slide_content_font_size: int = int(self._get_env('SLIDE_CONTENT_FONT_SIZE', '24'))
         self.slide_title_font_name: str = self._get_env('SLIDE_TITLE_FONT_NAME', 'Avenir')
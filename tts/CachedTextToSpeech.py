@@ -0,0 +1,71 @@
+from typing import List, Union
+from TextToSpeechService import TextToSpeechService, SynthesizedAudio
+from cache.AudioCache import AudioCache
+from cache.TieredAudioCache import TieredAudioCache
+from metrics.TTSMetrics import TTSMetrics
+
+class CachedTextToSpeech(TextToSpeechService):
+    """TextToSpeechService decorator that serves repeated requests from an AudioCache, optionally tiered."""
+
+    def __init__(self, tts_service: TextToSpeechService, cache: Union[AudioCache, TieredAudioCache]):
+        self.tts_service = tts_service
+        self.cache = cache
+        self.metrics = TTSMetrics()
+        self.audio_encoding = getattr(tts_service, "audio_encoding", "MP3")
+
+    def synthesize_audio(
+        self,
+        text: str,
+        voice_name: str = "en-US-Wavenet-F",
+        gender: str = "FEMALE",
+        language_code: str = "en-US",
+        speaking_rate: float = 1.0
+    ) -> SynthesizedAudio:
+        key = AudioCache.make_key(text, voice_name, language_code, speaking_rate, self.audio_encoding)
+
+        cached = self.cache.get(key)
+        self.metrics.record_cache(hit=cached is not None)
+        if cached is not None:
+            audio_content, duration = cached
+            print(f"TTS cache hit: {len(audio_content)} bytes ({duration:.2f}s) with voice {voice_name}")
+            return SynthesizedAudio(audio_content, duration, self.audio_encoding)
+
+        audio = self.tts_service.synthesize_audio(
+            text=text,
+            voice_name=voice_name,
+            gender=gender,
+            language_code=language_code,
+            speaking_rate=speaking_rate
+        )
+        self.cache.put(key, audio.audio_content, audio.duration)
+        return audio
+
+    def synthesize_batch(
+        self,
+        texts: List[str],
+        voice_name: str = "en-US-Wavenet-F",
+        gender: str = "FEMALE",
+        language_code: str = "en-US",
+        speaking_rate: float = 1.0
+    ) -> List[SynthesizedAudio]:
+        """Serve cached texts directly and send only the misses to the wrapped service as one batch."""
+        keys = [AudioCache.make_key(text, voice_name, language_code, speaking_rate, self.audio_encoding) for text in texts]
+        audios = [None] * len(texts)
+        missing = []
+        for index, key in enumerate(keys):
+            cached = self.cache.get(key)
+            self.metrics.record_cache(hit=cached is not None)
+            if cached is not None:
+                audios[index] = SynthesizedAudio(cached[0], cached[1], self.audio_encoding)
+            else:
+                missing.append(index)
+
+        if missing:
+            synthesized = self.tts_service.synthesize_batch(
+                [texts[index] for index in missing], voice_name, gender, language_code, speaking_rate
+            )
+            for index, audio in zip(missing, synthesized):
+                self.cache.put(keys[index], audio.audio_content, audio.duration)
+                audios[index] = audio
+        print(f"TTS cache: {len(texts) - len(missing)} of {len(texts)} batch items served from cache")
+        return audios
\ No newline at end of file
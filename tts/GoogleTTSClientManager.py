@@ -0,0 +1,194 @@
+import atexit
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+from google.api_core import exceptions as core_exceptions
+from google.cloud import texttospeech
+from google.cloud import texttospeech_v1beta1
+from AppConfig import AppConfig
+
+# Errors that point at a broken channel rather than a bad request
+CHANNEL_FAILURE_EXCEPTIONS = (
+    core_exceptions.ServiceUnavailable,
+    core_exceptions.DeadlineExceeded,
+    core_exceptions.InternalServerError,
+    core_exceptions.Unknown,
+)
+
+
+class PooledClient:
+    """A Google TTS client together with its health and usage bookkeeping."""
+    def __init__(self, client):
+        self.client = client
+        self.created_at = time.monotonic()
+        self.last_checked = self.created_at
+        self.failures = 0
+        # Callers currently using the client; a replaced client is closed when this drops to 0
+        self.in_use = 0
+        self.retired = False
+
+
+class GoogleTTSClientManager:
+    """
+    Process-wide pool of long-lived Google Text-to-Speech clients.
+
+    Clients keep their gRPC channel warm for the life of the process and are handed
+    out round-robin, so concurrent callers spread over several channels. A client is
+    rebuilt after repeated channel failures or when its periodic health check fails;
+    the client it replaces is closed only once the last caller using it has returned it,
+    so RPCs already running on it are never cut off.
+    The v1beta1 API, needed for SSML mark timepoints, gets its own pool.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        """Implement thread-safe singleton pattern."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(GoogleTTSClientManager, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """Initialize the client pool if not already initialized."""
+        with self._instance_lock:
+            if self._initialized:
+                return
+
+            self.config = AppConfig()
+            self.pool_size = max(1, self.config.tts_client_pool_size)
+            self.health_check_interval = self.config.tts_client_health_check_interval
+            self.max_failures = max(1, self.config.tts_client_max_failures)
+
+            self._lock = threading.Lock()
+            self._clients: Dict[bool, List[Optional[PooledClient]]] = {
+                False: [None] * self.pool_size,
+                True: [None] * self.pool_size,
+            }
+            self._next_index = {False: 0, True: 0}
+
+            atexit.register(self.close)
+            self._initialized = True
+
+    @contextmanager
+    def client(self, beta: bool = False):
+        """
+        Borrow a client from the pool; beta selects a v1beta1 client.
+
+        Channel failures raised inside the block are recorded against the client so it
+        gets rebuilt; the exception itself is always re-raised to the caller.
+        """
+        index, entry = self._acquire(beta)
+        try:
+            yield entry.client
+        except CHANNEL_FAILURE_EXCEPTIONS as e:
+            self._report_failure(beta, index, entry, e)
+            raise
+        else:
+            entry.failures = 0
+        finally:
+            self._release(entry)
+
+    def close(self):
+        """Close every pooled client and release their channels."""
+        with self._lock:
+            for clients in self._clients.values():
+                for index, entry in enumerate(clients):
+                    if entry is not None:
+                        self._close_client(entry)
+                        clients[index] = None
+
+    def _acquire(self, beta: bool) -> Tuple[int, PooledClient]:
+        """Pick the next slot round-robin and hold its client, building or rebuilding it when needed."""
+        clients = self._clients[beta]
+        with self._lock:
+            index = self._next_index[beta]
+            self._next_index[beta] = (index + 1) % self.pool_size
+
+            entry = clients[index]
+            rebuild = entry is None or entry.failures >= self.max_failures
+            needs_check = (
+                not rebuild
+                and self.health_check_interval > 0
+                and time.monotonic() - entry.last_checked >= self.health_check_interval
+            )
+            if needs_check:
+                # Claim the check so concurrent callers do not probe the same client
+                entry.last_checked = time.monotonic()
+            if not rebuild:
+                entry.in_use += 1
+
+        if needs_check and not self._is_healthy(entry):
+            print(f"Google TTS: client {index} failed health check, rebuilding")
+            self._release(entry)
+            rebuild = True
+        elif rebuild and entry is not None:
+            print(f"Google TTS: rebuilding client {index} after {entry.failures} failure(s)")
+
+        if rebuild:
+            entry = self._replace(beta, index, entry)
+        return index, entry
+
+    def _replace(self, beta: bool, index: int, old_entry: Optional[PooledClient]) -> PooledClient:
+        """
+        Build a client for the slot and hold it. The client is built outside the lock; when another
+        caller replaced the slot meanwhile, its client is used and the new one is discarded.
+        """
+        new_entry = PooledClient(self._create_client(beta))
+        clients = self._clients[beta]
+        close_old = False
+        with self._lock:
+            entry = clients[index]
+            if entry is old_entry or entry is None:
+                clients[index] = new_entry
+                if old_entry is not None:
+                    # Out of the slot, nobody can take it anymore; the last holder closes it
+                    old_entry.retired = True
+                    close_old = old_entry.in_use == 0
+                entry = new_entry
+            entry.in_use += 1
+        if entry is not new_entry:
+            self._close_client(new_entry)
+        if close_old:
+            self._close_client(old_entry)
+        return entry
+
+    def _release(self, entry: PooledClient):
+        """Return a held client, closing it when it was replaced and this was its last caller."""
+        with self._lock:
+            entry.in_use -= 1
+            close = entry.retired and entry.in_use == 0
+        if close:
+            self._close_client(entry)
+
+    @staticmethod
+    def _create_client(beta: bool):
+        """Create a new client for the v1 or v1beta1 API."""
+        if beta:
+            return texttospeech_v1beta1.TextToSpeechClient()
+        return texttospeech.TextToSpeechClient()
+
+    def _is_healthy(self, entry: PooledClient) -> bool:
+        """Probe the client's channel with a cheap voice listing call."""
+        try:
+            entry.client.list_voices(language_code="en-US", timeout=10)
+            return True
+        except Exception as e:
+            print(f"Google TTS: health check failed: {e}")
+            return False
+
+    def _report_failure(self, beta: bool, index: int, entry: PooledClient, error: Exception):
+        """Record a channel failure for the given client."""
+        with self._lock:
+            if self._clients[beta][index] is entry:
+                entry.failures += 1
+                print(f"Google TTS: client {index} failure {entry.failures}/{self.max_failures}: {error}")
+
+    def _close_client(self, entry: PooledClient):
+        """Close the client's transport, ignoring errors from an already broken channel."""
+        try:
+            entry.client.transport.close()
+        except Exception as e:
+            print(f"Google TTS: error closing client: {e}")
@@ -1,52 +1,171 @@
+import time
+import threading
+from typing import List
+from xml.sax.saxutils import escape
+from google.api_core import exceptions as core_exceptions
 from google.cloud import texttospeech
-from TextToSpeechService import TextToSpeechService
+from google.cloud import texttospeech_v1beta1
+from AppConfig import AppConfig
+from TextToSpeechService import TextToSpeechService, SynthesizedAudio, BatchUnsupportedError
+from audio.AudioInfo import AudioInfo
+from audio.AudioCodec import AudioCodec
+from GoogleTTSClientManager import GoogleTTSClientManager
+from metrics.TTSMetrics import TTSMetrics
 
 class GoogleTextToSpeech(TextToSpeechService):
     """Implementation of TextToSpeechService using Google Cloud Text-to-Speech."""
+    # Batches are packed into one SSML request
+    native_batching = True
 
-    def synthesize_speech(
+    def __init__(self):
+        self.config = AppConfig()
+        self.audio_encoding = self.config.tts_audio_encoding
+        # Shared pool of warm clients, reused across calls and threads
+        self.client_manager = GoogleTTSClientManager()
+        self.metrics = TTSMetrics()
+        # Voices that rejected SSML mark batches; their batches fail fast without a request
+        self._batch_unsupported_voices = set()
+        self._lock = threading.Lock()
+
+    def synthesize_audio(
         self, 
         text: str, 
-        output_filename: str, 
         voice_name: str = "en-US-Wavenet-F", 
         gender: str = "FEMALE", 
         language_code: str = "en-US",
         speaking_rate: float = 1.0
-    ):
-        # Initialize the Text-to-Speech client
-        client = texttospeech.TextToSpeechClient()
+    ) -> SynthesizedAudio:
+        request = self.build_synthesis_request(text, voice_name, gender, language_code, speaking_rate, self.audio_encoding)
+
+        # Synthesize speech with a pooled client
+        start = time.monotonic()
+        try:
+            with self.client_manager.client() as client:
+                response = client.synthesize_speech(**request, timeout=self.config.tts_request_timeout)
+        except Exception:
+            self.metrics.record_request(voice_name, language_code, len(text), time.monotonic() - start, success=False)
+            raise
+        self.metrics.record_request(voice_name, language_code, len(text), time.monotonic() - start, len(response.audio_content))
+
+        # Read the duration from the frame headers instead of re-reading a file
+        duration = AudioInfo.duration(response.audio_content, self.audio_encoding)
+        print(f"Google TTS: Synthesized {len(response.audio_content)} bytes ({duration:.2f}s) with voice {voice_name}")
+        return SynthesizedAudio(response.audio_content, duration, self.audio_encoding)
+
+    def synthesize_batch(
+        self,
+        texts: List[str],
+        voice_name: str = "en-US-Wavenet-F",
+        gender: str = "FEMALE",
+        language_code: str = "en-US",
+        speaking_rate: float = 1.0
+    ) -> List[SynthesizedAudio]:
+        """
+        Synthesize several short texts in one SSML request and split the audio per text.
+
+        Each text is enclosed by a start and an end <mark>; the timepoints returned for the
+        marks give the exact offsets at which the LINEAR16 audio is sliced, leaving out the
+        pauses between texts so a slice matches the single-item audio cached under the same
+        key. Slices are re-encoded to the configured encoding when it is not LINEAR16.
+
+        Raises BatchUnsupportedError when the voice rejects SSML marks or the timepoints are
+        incomplete, so the caller resubmits the texts one by one through the whole service
+        chain (and its rate limiter) instead of this method sending them behind its back.
+        """
+        if len(texts) <= 1:
+            return super().synthesize_batch(texts, voice_name, gender, language_code, speaking_rate)
+        with self._lock:
+            if voice_name in self._batch_unsupported_voices:
+                raise BatchUnsupportedError(f"voice {voice_name} does not support SSML mark batches")
 
+        ssml = self.build_batch_ssml(texts, self.config.tts_ssml_batch_break_ms)
+        request = self.build_synthesis_request(
+            ssml, voice_name, gender, language_code, speaking_rate, "LINEAR16", api=texttospeech_v1beta1, ssml=True
+        )
+        request["enable_time_pointing"] = [texttospeech_v1beta1.SynthesizeSpeechRequest.TimepointType.SSML_MARK]
+
+        start = time.monotonic()
+        try:
+            with self.client_manager.client(beta=True) as client:
+                response = client.synthesize_speech(
+                    request=texttospeech_v1beta1.SynthesizeSpeechRequest(**request),
+                    timeout=self.config.tts_request_timeout
+                )
+        except core_exceptions.InvalidArgument as e:
+            self.metrics.record_request(voice_name, language_code, len(ssml), time.monotonic() - start, success=False)
+            with self._lock:
+                self._batch_unsupported_voices.add(voice_name)
+            print(f"Google TTS: voice {voice_name} rejected an SSML batch, synthesizing its texts one by one: {e}")
+            raise BatchUnsupportedError(str(e)) from e
+        except Exception:
+            self.metrics.record_request(voice_name, language_code, len(ssml), time.monotonic() - start, success=False)
+            raise
+        self.metrics.record_request(voice_name, language_code, len(ssml), time.monotonic() - start, len(response.audio_content))
+
+        marks = {timepoint.mark_name: timepoint.time_seconds for timepoint in response.timepoints}
+        spans = [(marks.get(f"item{index}"), marks.get(f"item{index}_end")) for index in range(len(texts))]
+        if any(start is None or end is None for start, end in spans):
+            print(f"Google TTS: SSML batch of {len(texts)} items returned incomplete timepoints, synthesizing one by one")
+            raise BatchUnsupportedError(f"incomplete timepoints for a batch of {len(texts)} items")
+
+        audios = []
+        for start, end in spans:
+            # Cut at the end mark so the pause between items is not part of any slice
+            wav_content = AudioInfo.slice_wav(response.audio_content, start, end)
+            audio_content = AudioCodec.from_wav(wav_content, self.audio_encoding)
+            audios.append(SynthesizedAudio(
+                audio_content,
+                AudioInfo.duration(audio_content, self.audio_encoding),
+                self.audio_encoding
+            ))
+        print(f"Google TTS: Synthesized {len(texts)} items in one SSML request with voice {voice_name}")
+        return audios
+
+    @staticmethod
+    def build_batch_ssml(texts: List[str], break_ms: int) -> str:
+        """Build an SSML document with a mark before and after each text and a short pause between texts."""
+        parts = [
+            f'<mark name="item{index}"/>{escape(text)}<mark name="item{index}_end"/><break time="{break_ms}ms"/>'
+            for index, text in enumerate(texts)
+        ]
+        return f"<speak>{''.join(parts)}</speak>"
+
+    @staticmethod
+    def build_synthesis_request(
+        text: str,
+        voice_name: str,
+        gender: str,
+        language_code: str,
+        speaking_rate: float,
+        audio_encoding: str,
+        api=texttospeech,
+        ssml: bool = False
+    ) -> dict:
+        """
+        Build the keyword arguments of a synthesize_speech call, shared by the sync and async clients.
+        api selects the types module, texttospeech (v1) or texttospeech_v1beta1; ssml marks text as SSML.
+        """
         # Configure the input text
-        input_text = texttospeech.SynthesisInput(text=text)
+        input_text = api.SynthesisInput(ssml=text) if ssml else api.SynthesisInput(text=text)
 
         # Map gender string to SsmlVoiceGender enum
         gender_enum = {
-            "FEMALE": texttospeech.SsmlVoiceGender.FEMALE,
-            "MALE": texttospeech.SsmlVoiceGender.MALE,
-            "NEUTRAL": texttospeech.SsmlVoiceGender.NEUTRAL
-        }.get(gender.upper(), texttospeech.SsmlVoiceGender.FEMALE)
+            "FEMALE": api.SsmlVoiceGender.FEMALE,
+            "MALE": api.SsmlVoiceGender.MALE,
+            "NEUTRAL": api.SsmlVoiceGender.NEUTRAL
+        }.get(gender.upper(), api.SsmlVoiceGender.FEMALE)
 
         # Configure the voice settings
-        voice = texttospeech.VoiceSelectionParams(
+        voice = api.VoiceSelectionParams(
             language_code=language_code,  # Use the provided language code
             name=voice_name,  # Specific voice name
             ssml_gender=gender_enum
         )
 
         # Configure the audio settings
-        audio_config = texttospeech.AudioConfig(
-            audio_encoding=texttospeech.AudioEncoding.MP3,  # Output format
+        audio_config = api.AudioConfig(
+            audio_encoding=api.AudioEncoding[audio_encoding],  # Output format
             speaking_rate=speaking_rate
         )
 
-        # Synthesize speech
-        response = client.synthesize_speech(
-            input=input_text,
-            voice=voice,
-            audio_config=audio_config
-        )
-
-        # Save the audio to the specified file
-        with open(output_filename, "wb") as audio_file:
-            audio_file.write(response.audio_content)
-        print(f"Google TTS: Audio content written to file: {output_filename}")
\ No newline at end of file
+        return {"input": input_text, "voice": voice, "audio_config": audio_config}
\ No newline at end of file
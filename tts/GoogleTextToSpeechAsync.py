@@ -0,0 +1,128 @@
+import time
+import asyncio
+from typing import List, Optional
+from google.cloud import texttospeech
+from AppConfig import AppConfig
+from TextToSpeechService import TextToSpeechService, SynthesizedAudio
+from GoogleTextToSpeech import GoogleTextToSpeech
+from audio.AudioInfo import AudioInfo
+from metrics.TTSMetrics import TTSMetrics
+
+class GoogleTextToSpeechAsync(TextToSpeechService):
+    """
+    Asyncio implementation of TextToSpeechService using Google's TextToSpeechAsyncClient.
+
+    Requests share one async gRPC channel per event loop, so many in-flight requests
+    cost no threads. The synchronous synthesize_audio and synthesize_speech are kept for interface
+    compatibility and delegate to GoogleTextToSpeech's pooled clients, so they never start an
+    event loop of their own and also work when called from inside a running one.
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None):
+        self.config = AppConfig()
+        self.audio_encoding = self.config.tts_audio_encoding
+        self.max_concurrency = max_concurrency or self.config.tts_max_concurrency
+        self.metrics = TTSMetrics()
+        self._client = None
+        self._client_loop = None
+        self._sync_service = None
+
+    def synthesize_audio(
+        self,
+        text: str,
+        voice_name: str = "en-US-Wavenet-F",
+        gender: str = "FEMALE",
+        language_code: str = "en-US",
+        speaking_rate: float = 1.0
+    ) -> SynthesizedAudio:
+        if self._sync_service is None:
+            self._sync_service = GoogleTextToSpeech()
+        return self._sync_service.synthesize_audio(
+            text=text,
+            voice_name=voice_name,
+            gender=gender,
+            language_code=language_code,
+            speaking_rate=speaking_rate
+        )
+
+    async def synthesize_audio_async(
+        self,
+        text: str,
+        voice_name: str = "en-US-Wavenet-F",
+        gender: str = "FEMALE",
+        language_code: str = "en-US",
+        speaking_rate: float = 1.0
+    ) -> SynthesizedAudio:
+        """Synthesizes speech from input text and returns the audio bytes and duration in memory."""
+        request = GoogleTextToSpeech.build_synthesis_request(
+            text, voice_name, gender, language_code, speaking_rate, self.audio_encoding
+        )
+        start = time.monotonic()
+        try:
+            response = await self._get_client().synthesize_speech(**request, timeout=self.config.tts_request_timeout)
+        except Exception:
+            self.metrics.record_request(voice_name, language_code, len(text), time.monotonic() - start, success=False)
+            raise
+        self.metrics.record_request(voice_name, language_code, len(text), time.monotonic() - start, len(response.audio_content))
+        duration = AudioInfo.duration(response.audio_content, self.audio_encoding)
+        return SynthesizedAudio(response.audio_content, duration, self.audio_encoding)
+
+    async def synthesize_speech_async(
+        self,
+        text: str,
+        output_filename: str,
+        voice_name: str = "en-US-Wavenet-F",
+        gender: str = "FEMALE",
+        language_code: str = "en-US",
+        speaking_rate: float = 1.0
+    ) -> float:
+        """Synthesizes speech from input text, saves it without blocking the event loop and returns its duration."""
+        audio = await self.synthesize_audio_async(
+            text=text,
+            voice_name=voice_name,
+            gender=gender,
+            language_code=language_code,
+            speaking_rate=speaking_rate
+        )
+
+        # Hand the file write to a worker thread so the loop keeps serving other requests
+        await asyncio.to_thread(audio.save, output_filename)
+        print(f"Google TTS (async): Audio content written to file: {output_filename}")
+        return audio.duration
+
+    async def synthesize_many(self, items: List[dict]) -> list:
+        """
+        Synthesize many items concurrently, at most max_concurrency requests in flight.
+
+        Args:
+            items: List of keyword-argument dicts for synthesize_speech_async
+
+        Returns:
+            List of results in the same order as items
+        """
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def synthesize(item: dict):
+            async with semaphore:
+                return await self.synthesize_speech_async(**item)
+
+        return await asyncio.gather(*(synthesize(item) for item in items))
+
+    async def close(self):
+        """Close the async client's channel; call it from the loop that used the client."""
+        client, self._client, self._client_loop = self._client, None, None
+        if client is not None:
+            await client.transport.close()
+
+    def _get_client(self) -> texttospeech.TextToSpeechAsyncClient:
+        """Return the async client for the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            # gRPC aio channels are bound to the loop they were created on; close the previous
+            # channel on its own loop while that loop still runs (one whose loop has ended
+            # cannot be awaited anymore and is released with the client)
+            if self._client is not None and self._client_loop.is_running():
+                asyncio.run_coroutine_threadsafe(self._client.transport.close(), self._client_loop)
+            self._client = texttospeech.TextToSpeechAsyncClient()
+            self._client_loop = loop
+        return self._client
@@ -0,0 +1,108 @@
+import io
+import time
+import wave
+import random
+import hashlib
+import threading
+from typing import Dict
+from AppConfig import AppConfig
+from TextToSpeechService import TextToSpeechService, TransientTTSError, SynthesizedAudio
+from metrics.TTSMetrics import TTSMetrics
+
+# Silent MPEG-1 Layer III frame: 128 kbps, 44.1 kHz, mono, no CRC
+MP3_FRAME_HEADER = b"\xff\xfb\x90\xc4"
+MP3_FRAME_HEADER_PADDED = b"\xff\xfb\x92\xc4"
+MP3_SAMPLES_PER_FRAME = 1152
+MP3_SAMPLE_RATE = 44100
+MP3_BITRATE = 128000
+
+WAV_SAMPLE_RATE = 24000
+
+class OfflineTextToSpeech(TextToSpeechService):
+    """
+    Deterministic stand-in for a text-to-speech service that needs no network.
+
+    Produces valid silent audio whose duration scales with text length and speaking
+    rate, with configurable simulated latency and error rate. Meant for load testing
+    and profiling the slide, video and merge stages without credentials or quota.
+    """
+
+    def __init__(self):
+        self.config = AppConfig()
+        self.audio_encoding = self.config.tts_audio_encoding
+        self.chars_per_second = self.config.offline_tts_chars_per_second
+        self.latency_ms = self.config.offline_tts_latency_ms
+        self.error_rate = self.config.offline_tts_error_rate
+        self.seed = self.config.offline_tts_seed
+        self._attempts: Dict[str, int] = {}
+        self.metrics = TTSMetrics()
+        self._lock = threading.Lock()
+
+    def synthesize_audio(
+        self,
+        text: str,
+        voice_name: str = "en-US-Wavenet-F",
+        gender: str = "FEMALE",
+        language_code: str = "en-US",
+        speaking_rate: float = 1.0
+    ) -> SynthesizedAudio:
+        request_key = f"{voice_name}|{language_code}|{speaking_rate}|{text}"
+        rng = self._request_random(request_key)
+
+        if self.latency_ms > 0:
+            time.sleep(self.latency_ms / 1000)
+        if rng.random() < self.error_rate:
+            self.metrics.record_request(voice_name, language_code, len(text), self.latency_ms / 1000, success=False)
+            raise TransientTTSError(f"Offline TTS: simulated failure for text: {text[:40]!r}")
+
+        duration = self.estimate_duration(text, speaking_rate)
+        if self.audio_encoding == "LINEAR16":
+            audio_content, duration = self._silent_wav(duration)
+        else:
+            audio_content, duration = self._silent_mp3(duration)
+
+        self.metrics.record_request(voice_name, language_code, len(text), self.latency_ms / 1000, len(audio_content))
+        print(f"Offline TTS: Synthesized {len(audio_content)} bytes ({duration:.2f}s) with voice {voice_name}")
+        return SynthesizedAudio(audio_content, duration, self.audio_encoding)
+
+    def estimate_duration(self, text: str, speaking_rate: float = 1.0) -> float:
+        """Return the simulated speech duration in seconds for a text."""
+        rate = speaking_rate if speaking_rate and speaking_rate > 0 else 1.0
+        return max(0.5, len(text or "") / (self.chars_per_second * rate))
+
+    def _request_random(self, request_key: str) -> random.Random:
+        """
+        Return a random generator seeded by the request and its attempt number, so a run
+        fails the same requests every time while retries can still succeed.
+        """
+        with self._lock:
+            attempt = self._attempts.get(request_key, 0)
+            self._attempts[request_key] = attempt + 1
+        digest = hashlib.sha256(f"{self.seed}|{attempt}|{request_key}".encode("utf-8")).digest()
+        return random.Random(int.from_bytes(digest[:8], "big"))
+
+    @staticmethod
+    def _silent_mp3(duration: float) -> tuple[bytes, float]:
+        """Build silent MP3 data of about the given duration; returns the data and its exact duration."""
+        frame_count = max(1, round(duration * MP3_SAMPLE_RATE / MP3_SAMPLES_PER_FRAME))
+        # Frame length in bytes is 144 * bitrate / sample_rate for MPEG-1 Layer III
+        frame_size_numerator = MP3_SAMPLES_PER_FRAME // 8 * MP3_BITRATE
+        frames = []
+        for i in range(frame_count):
+            # Pad frames the way an encoder does so the average bitrate is exact
+            frame_length = (i + 1) * frame_size_numerator // MP3_SAMPLE_RATE - i * frame_size_numerator // MP3_SAMPLE_RATE
+            header = MP3_FRAME_HEADER_PADDED if frame_length > frame_size_numerator // MP3_SAMPLE_RATE else MP3_FRAME_HEADER
+            frames.append(header + bytes(frame_length - len(header)))
+        return b"".join(frames), frame_count * MP3_SAMPLES_PER_FRAME / MP3_SAMPLE_RATE
+
+    @staticmethod
+    def _silent_wav(duration: float) -> tuple[bytes, float]:
+        """Build silent 16-bit mono WAV data of the given duration; returns the data and its exact duration."""
+        sample_count = max(1, round(duration * WAV_SAMPLE_RATE))
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(WAV_SAMPLE_RATE)
+            wav_file.writeframes(bytes(sample_count * 2))
+        return buffer.getvalue(), sample_count / WAV_SAMPLE_RATE
\ No newline at end of file
@@ -0,0 +1,55 @@
+from typing import List
+from TextToSpeechService import TextToSpeechService, SynthesizedAudio
+from metrics.TTSMetrics import TTSMetrics
+
+class RateLimitedTextToSpeech(TextToSpeechService):
+    """
+    TextToSpeechService decorator that takes a token from a shared token bucket before each request.
+
+    It wraps the backend directly, so retries and hedged duplicates are counted against
+    the quota like any other request.
+    """
+
+    def __init__(self, tts_service: TextToSpeechService, limiter):
+        self.tts_service = tts_service
+        self.limiter = limiter
+        self.metrics = TTSMetrics()
+        self.audio_encoding = getattr(tts_service, "audio_encoding", "MP3")
+
+    def synthesize_audio(
+        self,
+        text: str,
+        voice_name: str = "en-US-Wavenet-F",
+        gender: str = "FEMALE",
+        language_code: str = "en-US",
+        speaking_rate: float = 1.0
+    ) -> SynthesizedAudio:
+        self._acquire()
+        return self.tts_service.synthesize_audio(
+            text=text,
+            voice_name=voice_name,
+            gender=gender,
+            language_code=language_code,
+            speaking_rate=speaking_rate
+        )
+
+    def synthesize_batch(
+        self,
+        texts: List[str],
+        voice_name: str = "en-US-Wavenet-F",
+        gender: str = "FEMALE",
+        language_code: str = "en-US",
+        speaking_rate: float = 1.0
+    ) -> List[SynthesizedAudio]:
+        # A natively batched request is a single request against the quota; otherwise the
+        # backend loops over the texts and sends one request per text
+        requests = 1 if self.tts_service.native_batching and len(texts) > 1 else len(texts)
+        for _ in range(requests):
+            self._acquire()
+        return self.tts_service.synthesize_batch(texts, voice_name, gender, language_code, speaking_rate)
+
+    def _acquire(self):
+        """Wait for a token and record the time spent throttled."""
+        waited = self.limiter.acquire()
+        if waited > 0:
+            self.metrics.record_throttle(waited)
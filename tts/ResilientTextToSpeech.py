@@ -0,0 +1,137 @@
+import time
+import random
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, List, Optional
+from google.api_core import exceptions as core_exceptions
+from AppConfig import AppConfig
+from TextToSpeechService import TextToSpeechService, TransientTTSError, SynthesizedAudio
+from metrics.TTSMetrics import TTSMetrics
+
+# Errors worth retrying: the same request is expected to succeed later
+RETRYABLE_EXCEPTIONS = (
+    TransientTTSError,
+    core_exceptions.ServiceUnavailable,
+    core_exceptions.DeadlineExceeded,
+    core_exceptions.ResourceExhausted,
+)
+
+class ResilientTextToSpeech(TextToSpeechService):
+    """
+    TextToSpeechService decorator that retries transient failures and hedges slow calls.
+
+    Transient errors are retried with full-jitter exponential backoff. When hedging is
+    enabled, a duplicate request is sent once a call runs past the configured latency
+    percentile of recent calls, and whichever finishes first wins.
+    """
+
+    def __init__(self, tts_service: TextToSpeechService):
+        self.tts_service = tts_service
+        self.config = AppConfig()
+        self.audio_encoding = getattr(tts_service, "audio_encoding", "MP3")
+
+        self.max_attempts = max(1, self.config.tts_retry_max_attempts)
+        self.base_delay = self.config.tts_retry_base_delay
+        self.max_delay = self.config.tts_retry_max_delay
+        self.hedge_enabled = self.config.tts_hedge_enabled
+        self.hedge_percentile = self.config.tts_hedge_percentile
+        self.hedge_min_samples = self.config.tts_hedge_min_samples
+
+        self.metrics = TTSMetrics()
+        self._latencies = deque(maxlen=200)
+        self._lock = threading.Lock()
+        self._executor = None
+        if self.hedge_enabled:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(2, self.config.tts_max_concurrency * 4),
+                thread_name_prefix="tts-hedge"
+            )
+
+    def synthesize_audio(
+        self,
+        text: str,
+        voice_name: str = "en-US-Wavenet-F",
+        gender: str = "FEMALE",
+        language_code: str = "en-US",
+        speaking_rate: float = 1.0
+    ) -> SynthesizedAudio:
+        request = dict(
+            text=text,
+            voice_name=voice_name,
+            gender=gender,
+            language_code=language_code,
+            speaking_rate=speaking_rate
+        )
+
+        if self.hedge_enabled:
+            return self._with_retries(text, lambda: self._synthesize_hedged(request))
+        return self._with_retries(text, lambda: self._synthesize_timed(request))
+
+    def synthesize_batch(
+        self,
+        texts: List[str],
+        voice_name: str = "en-US-Wavenet-F",
+        gender: str = "FEMALE",
+        language_code: str = "en-US",
+        speaking_rate: float = 1.0
+    ) -> List[SynthesizedAudio]:
+        # Batches are retried as a whole but never hedged, their latency is not comparable to single calls
+        return self._with_retries(
+            " | ".join(texts),
+            lambda: self.tts_service.synthesize_batch(texts, voice_name, gender, language_code, speaking_rate)
+        )
+
+    def _with_retries(self, text: str, call: Callable):
+        """Run call, retrying transient errors with full-jitter exponential backoff."""
+        for attempt in range(self.max_attempts):
+            try:
+                return call()
+            except RETRYABLE_EXCEPTIONS as e:
+                if attempt == self.max_attempts - 1:
+                    print(f"TTS: giving up on {text[:40]!r} after {self.max_attempts} attempts: {e}")
+                    raise
+                delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+                print(f"TTS: transient error for {text[:40]!r} (attempt {attempt + 1}/{self.max_attempts}), retrying in {delay:.2f}s: {e}")
+                self.metrics.record_retry()
+                time.sleep(delay)
+
+    def _synthesize_timed(self, request: dict) -> SynthesizedAudio:
+        """Run one request against the wrapped service and record its latency."""
+        start = time.monotonic()
+        audio = self.tts_service.synthesize_audio(**request)
+        with self._lock:
+            self._latencies.append(time.monotonic() - start)
+        return audio
+
+    def _synthesize_hedged(self, request: dict) -> SynthesizedAudio:
+        """Run a request, sending a duplicate if it is slower than the hedge threshold."""
+        futures = [self._executor.submit(self._synthesize_timed, request)]
+        hedge_delay = self._hedge_delay()
+
+        if hedge_delay is not None:
+            done, _ = wait(futures, timeout=hedge_delay)
+            if not done:
+                print(f"TTS: request for {request['text'][:40]!r} slower than {hedge_delay:.2f}s, sending hedged request")
+                self.metrics.record_hedge()
+                futures.append(self._executor.submit(self._synthesize_timed, request))
+
+        # The first successful response wins; a late duplicate is simply dropped
+        pending = set(futures)
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = error or future.exception()
+        raise error
+
+    def _hedge_delay(self) -> Optional[float]:
+        """Return the latency percentile of recent calls, or None until enough samples exist."""
+        with self._lock:
+            if len(self._latencies) < self.hedge_min_samples:
+                return None
+            latencies = sorted(self._latencies)
+        index = min(len(latencies) - 1, int(len(latencies) * self.hedge_percentile / 100))
+        return latencies[index]
@@ -2,13 +2,27 @@
 import os
 import json
 import tempfile
-from typing import Dict, Set, Union
+from typing import Dict, List, Set, Union
 from moviepy import *
 from AppConfig import AppConfig
 from Conversations import Conversations
+from TextToSpeechService import TextToSpeechService
 from GoogleTextToSpeech import GoogleTextToSpeech
+from OfflineTextToSpeech import OfflineTextToSpeech
+from ResilientTextToSpeech import ResilientTextToSpeech
+from CachedTextToSpeech import CachedTextToSpeech
+from RateLimitedTextToSpeech import RateLimitedTextToSpeech
+from ratelimit.FileTokenBucket import FileTokenBucket
+from ratelimit.MongoTokenBucket import MongoTokenBucket
+from VoiceCatalog import VoiceCatalog
+from cache.AudioCache import AudioCache
+from cache.GridFSAudioCache import GridFSAudioCache
+from cache.TieredAudioCache import TieredAudioCache
+from cache.SlideImageCache import SlideImageCache
+from metrics.TTSMetrics import TTSMetrics
 from processors.SpeechGenerator import SpeechGenerator
 from processors.SlideGenerator import SlideGenerator
+from processors.SlideRasterizer import SlideRasterizer
 from processors.VideoGenerator import VideoGenerator
 from database.MongoDBConnection import MongoDBConnection
 from uploaders.YouTubeUploader import YouTubeUploader
@@ -70,11 +84,19 @@ class TextToSpeechProcessor:
 
         self.gender_to_google_tts_voice_name = GENDER_TO_GOOGLE_TTS_VOICE_NAMES_MAP.get(self.language, GENDER_TO_GOOGLE_TTS_VOICE_NAMES_ENGLISH)
         
+        # Per-run TTS usage and latency metrics
+        self.tts_metrics = TTSMetrics()
+        self.tts_metrics.reset()
+
         # Initialize processors
-        google_tts = GoogleTextToSpeech()
-        self.speech_generator = SpeechGenerator(google_tts)
-        self.slide_generator = SlideGenerator()
+        self.tts_service = self._create_tts_service()
+        self.speech_generator = SpeechGenerator(self.tts_service)
+        self.slide_generator = self._create_slide_generator()
         self.video_generator = VideoGenerator()
+        if self.config.slide_image_cache_enabled:
+            self.slide_image_cache = SlideImageCache(self.config.slide_image_cache_dir, self.config.slide_image_cache_max_bytes)
+        else:
+            self.slide_image_cache = None
         
         # Voice management
         self.speaker_to_voice: Dict[str, str] = {}
@@ -95,6 +117,57 @@ class TextToSpeechProcessor:
         # Initialize voice assignments
         self.assign_voices_to_speakers()
 
+    def _create_tts_service(self) -> TextToSpeechService:
+        """
+        Build the configured text-to-speech backend: rate limited when configured, with retries,
+        wrapped in the (optionally shared) audio cache when enabled.
+        """
+        if self.config.tts_backend == "offline":
+            tts_service = OfflineTextToSpeech()
+        elif self.config.tts_backend == "google":
+            tts_service = GoogleTextToSpeech()
+        else:
+            raise ValueError(f"Unknown TTS backend: {self.config.tts_backend}")
+        limiter = self._create_rate_limiter()
+        if limiter is not None:
+            tts_service = RateLimitedTextToSpeech(tts_service, limiter)
+        tts_service = ResilientTextToSpeech(tts_service)
+        if self.config.tts_cache_enabled:
+            self.tts_cache = AudioCache(self.config.tts_cache_dir, self.config.tts_cache_max_bytes)
+            if self.config.tts_shared_cache_enabled:
+                self.tts_cache = TieredAudioCache(self.tts_cache, GridFSAudioCache(self.config.tts_shared_cache_bucket))
+            tts_service = CachedTextToSpeech(tts_service, self.tts_cache)
+        else:
+            self.tts_cache = None
+        return tts_service
+
+    def _create_slide_generator(self):
+        """Build the configured slide renderer: PPTX slides for LibreOffice, or PNG slides drawn directly."""
+        if self.config.slide_renderer == "pptx":
+            return SlideGenerator()
+        if self.config.slide_renderer == "raster":
+            return SlideRasterizer()
+        raise ValueError(f"Unknown slide renderer: {self.config.slide_renderer}")
+
+    def _create_rate_limiter(self):
+        """Build the configured shared token bucket, or None when rate limiting is disabled."""
+        backend = self.config.tts_rate_limit_backend
+        if backend == "none":
+            return None
+        if backend == "file":
+            return FileTokenBucket(
+                self.config.tts_rate_limit_file,
+                self.config.tts_rate_limit_per_minute,
+                self.config.tts_rate_limit_burst
+            )
+        if backend == "mongodb":
+            return MongoTokenBucket(
+                self.config.tts_rate_limit_name,
+                self.config.tts_rate_limit_per_minute,
+                self.config.tts_rate_limit_burst
+            )
+        raise ValueError(f"Unknown TTS rate limit backend: {backend}")
+
     def _get_language_code(self) -> str:
         """Get the language code for the current conversation."""
         # language = self.conversations_data.language
@@ -106,6 +179,9 @@ class TextToSpeechProcessor:
 
     def assign_voices_to_speakers(self):
         """Assign unique voices to each speaker based on their gender."""
+        if self.config.voice_validation_enabled:
+            self.gender_to_google_tts_voice_name = self._validate_voice_map(self.gender_to_google_tts_voice_name)
+
         for speaker_name, speaker in self.conversations_data.speakers.items():
             gender = speaker.gender.lower()
             available_voices = self.gender_to_google_tts_voice_name.get(
@@ -124,41 +200,74 @@ class TextToSpeechProcessor:
             if speaker_name not in self.speaker_to_voice:
                 self.speaker_to_voice[speaker_name] = self.gender_to_google_tts_voice_name[self.config.default_speaker][0]
 
+    def _validate_voice_map(self, voice_map: Dict[str, list]) -> Dict[str, list]:
+        """
+        Drop voice names the voice catalog does not know for the current language, before any synthesis.
+        A gender left without voices falls back to the catalog's voices of the same SSML gender;
+        ValueError is raised when the catalog has none.
+        """
+        catalog = VoiceCatalog()
+        language_code = self._get_language_code()
+        if not catalog.is_known():
+            return voice_map
+        if not catalog.voices(language_code):
+            print(f"Voice catalog has no voices for {language_code}, voice names will not be validated")
+            return voice_map
+
+        validated = {}
+        for gender, voices in voice_map.items():
+            valid_voices = [voice for voice in voices if catalog.is_available(voice, language_code)]
+            for voice in voices:
+                if voice not in valid_voices:
+                    print(f"Voice {voice} is not available for {language_code}, skipping it")
+
+            if not valid_voices:
+                valid_voices = catalog.voices(language_code, gender)
+                if not valid_voices:
+                    raise ValueError(f"No {gender} voice is available for {language_code} in the voice catalog")
+                print(f"No configured {gender} voice is available for {language_code}, falling back to {valid_voices[0]}")
+            validated[gender] = valid_voices
+        return validated
+
     def process_conversations(self):
         """Process conversations and generate media files."""
         json_dir = os.path.dirname(os.path.abspath(self.json_file))
-        
-        for conversation in self.conversations_data.get_conversations():
-            # Create necessary directories
-            audio_dir = os.path.join(json_dir, "audio_conversations")
-            slide_dir = os.path.join(json_dir, "slide_conversations")
-            video_dir = os.path.join(json_dir, "video_conversations")
-            
-            for directory in [audio_dir, slide_dir, video_dir]:
-                os.makedirs(directory, exist_ok=True)
+        conversations = self.conversations_data.get_conversations()
 
-            # Generate speech
-            audio_file = os.path.join(audio_dir, f"{conversation.order}_{conversation.speaker.name}.{self.config.audio_format}")
-            audio_file, audio_length = self.speech_generator.generate_speech(
+        # Create necessary directories
+        audio_dir = os.path.join(json_dir, "audio_conversations")
+        slide_dir = os.path.join(json_dir, "slide_conversations")
+        video_dir = os.path.join(json_dir, "video_conversations")
+
+        for directory in [audio_dir, slide_dir, video_dir]:
+            os.makedirs(directory, exist_ok=True)
+
+        # Generate speech for all lines concurrently
+        speech_results = self.speech_generator.generate_speech_many([
+            dict(
                 sleep = getattr(conversation, "sleep", 0),
                 text=conversation.text,
-                output_file=audio_file,
+                output_file=os.path.join(audio_dir, f"{conversation.order}_{conversation.speaker.name}.{self.config.audio_format}"),
                 voice_name=self.speaker_to_voice[conversation.speaker.name],
                 gender=conversation.speaker.gender.upper(),
                 language_code=self._get_language_code(),
                 speaking_rate=self.speaking_rate
             )
-            
-            # Generate slide
-            slide_file = os.path.join(slide_dir, f"{conversation.order}_{conversation.speaker.name}.pptx")
-            slide_file = self.slide_generator.create_slide(
+            for conversation in conversations
+        ])
+
+        # Generate slides
+        slide_files = self._create_slides([
+            dict(
                 title=conversation.speaker.name,
                 content=conversation.text,
                 translated_content=conversation.translated_text,
-                background_image=self.conversations_data.get_conversations_background(),
-                output_file=slide_file
+                output_file=os.path.join(slide_dir, f"{conversation.order}_{conversation.speaker.name}.pptx")
             )
-            
+            for conversation in conversations
+        ], self.conversations_data.get_conversations_background(), os.path.join(slide_dir, "conversations_deck.pptx"))
+
+        for conversation, (audio_file, audio_length), slide_file in zip(conversations, speech_results, slide_files):
             # Generate video
             video_file = os.path.join(video_dir, f"{conversation.order}_{conversation.speaker.name}.{self.config.video_format}")
             video_file = self.video_generator.create_video(
@@ -177,43 +286,42 @@ class TextToSpeechProcessor:
     def process_new_words(self):
         """Process new words and generate media files."""
         json_dir = os.path.dirname(os.path.abspath(self.json_file))
-        
-        for new_word in self.conversations_data.get_new_words():
-            # Create necessary directories
-            audio_dir = os.path.join(json_dir, "audio_new_words")
-            slide_dir = os.path.join(json_dir, "slide_new_words")
-            video_dir = os.path.join(json_dir, "video_new_words")
-            
-            for directory in [audio_dir, slide_dir, video_dir]:
-                os.makedirs(directory, exist_ok=True)
+        new_words = self.conversations_data.get_new_words()
+
+        # Create necessary directories
+        audio_dir = os.path.join(json_dir, "audio_new_words")
+        slide_dir = os.path.join(json_dir, "slide_new_words")
+        video_dir = os.path.join(json_dir, "video_new_words")
 
-            # Prepare text for speech
-            text_to_speak = self._prepare_new_word_text(new_word)
+        for directory in [audio_dir, slide_dir, video_dir]:
+            os.makedirs(directory, exist_ok=True)
 
-            # Generate speech
-            audio_file = os.path.join(audio_dir, f"new_word_{new_word.order}.{self.config.audio_format}")
-            audio_file, audio_length = self.speech_generator.generate_speech(
+        # Generate speech for all new words concurrently
+        speech_results = self.speech_generator.generate_speech_many([
+            dict(
                 sleep = getattr(new_word, "sleep", 0),
-                text=text_to_speak,
-                output_file=audio_file,
+                text=self._prepare_new_word_text(new_word),
+                output_file=os.path.join(audio_dir, f"new_word_{new_word.order}.{self.config.audio_format}"),
                 voice_name=self.gender_to_google_tts_voice_name[self.config.default_speaker][0],
                 gender=self.config.default_speaker,
                 language_code=self._get_language_code(),
                 speaking_rate=self.speaking_rate
             )
+            for new_word in new_words
+        ])
 
-            # Generate slide
-            slide_file = os.path.join(slide_dir, f"new_word_{new_word.order}.pptx")
-            content = self._prepare_new_word_slide_content(new_word)
-            translated_content = self._prepare_new_word_slide_translated_content(new_word)
-            slide_file = self.slide_generator.create_slide(
+        # Generate slides
+        slide_files = self._create_slides([
+            dict(
                 title=new_word.word or "",
-                content=content,
-                translated_content=translated_content,
-                background_image=self.conversations_data.get_new_words_background(),
-                output_file=slide_file
+                content=self._prepare_new_word_slide_content(new_word),
+                translated_content=self._prepare_new_word_slide_translated_content(new_word),
+                output_file=os.path.join(slide_dir, f"new_word_{new_word.order}.pptx")
             )
+            for new_word in new_words
+        ], self.conversations_data.get_new_words_background(), os.path.join(slide_dir, "new_words_deck.pptx"))
 
+        for new_word, (audio_file, audio_length), slide_file in zip(new_words, speech_results, slide_files):
             # Generate video
             video_file = os.path.join(video_dir, f"new_word_{new_word.order}.{self.config.video_format}")
             video_file = self.video_generator.create_video(
@@ -229,6 +337,60 @@ class TextToSpeechProcessor:
             new_word.slide = slide_file
             new_word.video = video_file
 
+    def _create_slides(self, slide_requests: List[dict], background_image: str, deck_file: str) -> List[str]:
+        """
+        Create the slide of every request and return their files in order.
+        With the slide image cache, slides rendered before are copied from the cache and
+        only the others are built and converted, then stored in the cache.
+        """
+        if not self.slide_image_cache:
+            return self._build_slides(slide_requests, background_image, deck_file)
+
+        keys = []
+        slide_files = []
+        for request in slide_requests:
+            key = self.slide_image_cache.make_key(
+                request.get("title"), request.get("content"), request.get("translated_content"),
+                background_image, self.config.slide_logo_file, self.config
+            )
+            keys.append(key)
+            slide_files.append(self.slide_image_cache.get(key, os.path.splitext(request["output_file"])[0] + ".png"))
+
+        missing = [index for index, slide_file in enumerate(slide_files) if slide_file is None]
+        if missing:
+            print(f"Slide image cache: {len(slide_requests) - len(missing)} of {len(slide_requests)} slides reused")
+            built_files = self._build_slides([slide_requests[index] for index in missing], background_image, deck_file)
+            for index, slide_file in zip(missing, built_files):
+                if slide_file.lower().endswith(".png"):
+                    self.slide_image_cache.put(keys[index], slide_file)
+                slide_files[index] = slide_file
+        return slide_files
+
+    def _build_slides(self, slide_requests: List[dict], background_image: str, deck_file: str) -> List[str]:
+        """
+        Build the slide of every request and return their files in order.
+        With batch conversion, the section becomes one deck converted in a single pass and
+        each request gets its page image; otherwise, or if that fails, slides are created one by
+        one and converted to images in parallel. A slide whose conversion failed keeps its file.
+        """
+        if self.config.slide_batch_conversion and isinstance(self.slide_generator, SlideGenerator) and slide_requests:
+            try:
+                self.slide_generator.create_deck(slide_requests, background_image, deck_file)
+                image_files = self.video_generator.convert_deck_to_images(deck_file, len(slide_requests))
+            except Exception as e:
+                print(f"Error creating deck {deck_file}: {e}")
+                image_files = None
+            if image_files:
+                return image_files
+            print(f"Batch conversion of {deck_file} failed, converting slides one by one")
+
+        slide_files = [
+            self.slide_generator.create_slide(background_image=background_image, **request)
+            for request in slide_requests
+        ]
+        image_files = self.video_generator.convert_slides_to_images(slide_files)
+        return [image_file or slide_file for slide_file, image_file in zip(slide_files, image_files)]
+
     def _prepare_new_word_text(self, new_word) -> str:
         """Prepare text for new word speech synthesis."""
         meaning_label = NEW_WORD_MEANING_BY_LANGUAGE.get(self.config.default_language, "Meaning")
@@ -350,13 +512,18 @@ class TextToSpeechProcessor:
                 
             self.conversations_data.merged_video_all = output_file
 
-    def _merge_video_clips_v2(self, video_files: list, output_file: str):
-        """Merge multiple video files into one, never merging more than batch_size videos at once."""
+    def _merge_video_clips_v2(self, video_files: list, output_file: str, final: bool = True):
+        """
+        Merge multiple video files into one, never merging more than batch_size videos at once.
+        Intermediate (non-final) merges keep the intermediate audio codec.
+        """
         if not video_files:
             print("No videos found to merge.")
             return
 
         print(f"Merging {len(video_files)} videos into {output_file}")
+        if self._concat_video_clips(video_files, output_file, final):
+            return
         # Create a temporary directory for intermediate files
         temp_dir = os.path.join(os.path.dirname(output_file), "temp_merges")
         os.makedirs(temp_dir, exist_ok=True)
@@ -372,13 +539,13 @@ class TextToSpeechProcessor:
                 right_group = video_files[mid:]
                 
                 # Create temporary files for each group
-                left_temp = os.path.join(temp_dir, "left_temp.mp4")
-                right_temp = os.path.join(temp_dir, "right_temp.mp4")
+                left_temp = os.path.join(temp_dir, f"left_temp.{self.config.intermediate_video_format}")
+                right_temp = os.path.join(temp_dir, f"right_temp.{self.config.intermediate_video_format}")
                 temp_files.extend([left_temp, right_temp])
                 
                 # Recursively merge each group
-                self._merge_video_clips_v2(left_group, left_temp)
-                self._merge_video_clips_v2(right_group, right_temp)
+                self._merge_video_clips_v2(left_group, left_temp, final=False)
+                self._merge_video_clips_v2(right_group, right_temp, final=False)
                 
                 # Merge the two temporary files
                 clips = [VideoFileClip(left_temp), VideoFileClip(right_temp)]
@@ -386,7 +553,7 @@ class TextToSpeechProcessor:
                 final_video.write_videofile(
                     output_file,
                     codec=f"{self.config.merged_video_codec}",
-                    audio_codec=f"{self.config.merged_audio_codec}",
+                    audio_codec=f"{self._merge_audio_codec(final)}",
                     fps=self.config.merged_video_fps
                 )
                 print(f"Final merged video saved to {output_file}")
@@ -409,7 +576,7 @@ class TextToSpeechProcessor:
                     final_video.write_videofile(
                         output_file,
                         codec=f"{self.config.merged_video_codec}",
-                        audio_codec=f"{self.config.merged_audio_codec}",
+                        audio_codec=f"{self._merge_audio_codec(final)}",
                         fps=self.config.merged_video_fps
                     )
                     print(f"Video saved to {output_file}")
@@ -433,6 +600,24 @@ class TextToSpeechProcessor:
             except Exception as e:
                 print(f"Error removing temporary directory {temp_dir}: {e}")
 
+    def _concat_video_clips(self, video_files: list, output_file: str, final: bool) -> bool:
+        """
+        Merge the videos in one pass without re-encoding the video, when their streams match.
+        Returns False when the videos have to be merged by re-encoding instead.
+        """
+        existing_files = [video_file for video_file in video_files if video_file and os.path.exists(video_file)]
+        if not existing_files or not self.video_generator.concat_videos(existing_files, output_file, self._merge_audio_codec(final)):
+            return False
+        # Missing videos are skipped like in the re-encoding merge, which reports them otherwise
+        for video_file in video_files:
+            if video_file not in existing_files:
+                print(f"Video file not found: {video_file}")
+        return True
+
+    def _merge_audio_codec(self, final: bool) -> str:
+        """Return the audio codec for a merge output: intermediates may stay lossless, final outputs never do."""
+        return self.config.merged_audio_codec if final else self.config.intermediate_audio_codec
+
     def _merge_video_clips(self, video_files: list, output_file: str):
         """Merge multiple video files into one."""
         if self.config.use_v2_merge:
@@ -445,6 +630,8 @@ class TextToSpeechProcessor:
                 return
 
             print(f"Merging {len(video_files)} videos into {output_file}")
+            if self._concat_video_clips(video_files, output_file, final=True):
+                return
             # Create a temporary directory for intermediate files
             temp_dir = os.path.join(os.path.dirname(output_file), "temp_merges")
             os.makedirs(temp_dir, exist_ok=True)
@@ -466,7 +653,7 @@ class TextToSpeechProcessor:
 
                     if clips:
                         # Create temporary file for this batch
-                        temp_output = os.path.join(temp_dir, f"temp_merge_{i//batch_size}.mp4")
+                        temp_output = os.path.join(temp_dir, f"temp_merge_{i//batch_size}.{self.config.intermediate_video_format}")
                         print(f"Creating temporary file: {temp_output}")
                         temp_files.append(temp_output)
 
@@ -475,7 +662,7 @@ class TextToSpeechProcessor:
                         batch_video.write_videofile(
                             temp_output,
                             codec=f"{self.config.merged_video_codec}",
-                            audio_codec=f"{self.config.merged_audio_codec}",
+                            audio_codec=f"{self._merge_audio_codec(final=False)}",
                             fps=self.config.merged_video_fps
                         )
                         print(f"Batch {i//batch_size + 1} merged to temporary file: {temp_output}")
@@ -501,6 +688,17 @@ class TextToSpeechProcessor:
                     for clip in final_clips:
                         clip.close()
                     final_video.close()
+                elif len(temp_files) == 1 and self.config.lossless_intermediate_audio:
+                    # The batch still carries PCM audio, encode it once for the final output
+                    batch_clip = VideoFileClip(temp_files[0])
+                    batch_clip.write_videofile(
+                        output_file,
+                        codec=f"{self.config.merged_video_codec}",
+                        audio_codec=f"{self.config.merged_audio_codec}",
+                        fps=self.config.merged_video_fps
+                    )
+                    batch_clip.close()
+                    print(f"Single batch video saved to {output_file}")
                 elif len(temp_files) == 1:
                     # If only one batch, just rename the temporary file
                     os.rename(temp_files[0], output_file)
@@ -668,6 +866,19 @@ class TextToSpeechProcessor:
                 if mongo_conn:
                     mongo_conn.disconnect()
 
+    def save_tts_metrics(self) -> dict:
+        """Save the TTS metrics summary of this run to a JSON file and return it."""
+        output_file = os.path.splitext(self.json_file)[0] + "_tts_metrics.json"
+        summary = self.tts_metrics.save(output_file, extra={
+            "document_id": self.conversations_data.get_document_id(),
+            "topic": self.conversations_data.topic,
+            "language_code": self._get_language_code(),
+            "speaking_rate": self.speaking_rate,
+            "tts_backend": self.config.tts_backend,
+        })
+        print(f"TTS metrics saved to {output_file}")
+        return summary
+
     def _clean_hashtags(self, hashtags: list) -> list:
         """
         Remove '#' symbol from the beginning of each hashtag if present.
@@ -807,10 +1018,23 @@ class TextToSpeechProcessor:
             except Exception as e:
                 print(f"Error deleting folder {folder}: {e}")
 
+    def flush_caches(self):
+        """Persist the indexes of the audio and slide image caches and print their stats."""
+        if self.tts_cache:
+            self.tts_cache.flush()
+            print(f"TTS cache stats: {self.tts_cache.stats()}")
+        if self.slide_image_cache:
+            self.slide_image_cache.flush()
+            print(f"Slide image cache stats: {self.slide_image_cache.stats()}")
+
     def generate(self):
         """Run the entire text-to-speech processing pipeline."""
-        self.process_conversations()
-        self.process_new_words()
+        try:
+            self.process_conversations()
+            self.process_new_words()
+        finally:
+            # Persist the cache indexes even when a step fails, so the entries stored so far are kept
+            self.flush_caches()
         self.merge_videos()
         if self.config.enable_background_music:
             print("Adding background music to merged video")
@@ -819,6 +1043,8 @@ class TextToSpeechProcessor:
         else:
             print("Background music is disabled, skipping addition to merged video")
         self.save_decorated_data()
+        # Save TTS usage and latency metrics next to the decorated data
+        self.save_tts_metrics()
         self.delete_media_folders()
 
     def upload(self):
@@ -1,16 +1,94 @@
 from abc import ABC, abstractmethod
+from typing import List
+
+class TransientTTSError(Exception):
+    """Raised by a text-to-speech service for failures that are worth retrying."""
+    pass
+
+class BatchUnsupportedError(Exception):
+    """Raised by synthesize_batch when the texts cannot be synthesized as one request; callers send them one by one."""
+    pass
+
+class SynthesizedAudio:
+    """Synthesized audio kept in memory together with its duration."""
+    def __init__(self, audio_content: bytes, duration: float, audio_encoding: str = "MP3"):
+        """
+        Initialize a SynthesizedAudio object.
+        :param audio_content: The encoded audio bytes.
+        :param duration: Length of the audio in seconds.
+        :param audio_encoding: Encoding of audio_content, e.g. MP3 or LINEAR16.
+        """
+        self.audio_content = audio_content
+        self.duration = duration
+        self.audio_encoding = audio_encoding
+
+    def save(self, output_filename: str) -> str:
+        """Write the audio to a file and return its path."""
+        with open(output_filename, "wb") as audio_file:
+            audio_file.write(self.audio_content)
+        return output_filename
+
+    def __repr__(self):
+        return (f"SynthesizedAudio(bytes={len(self.audio_content)}, duration={self.duration}, "
+                f"audio_encoding='{self.audio_encoding}')")
 
 class TextToSpeechService(ABC):
     """Abstract base class for text-to-speech services."""
+    # True when synthesize_batch sends a whole batch as a single request
+    native_batching = False
 
     @abstractmethod
+    def synthesize_audio(
+        self,
+        text: str,
+        voice_name: str = "en-US-Wavenet-F",
+        gender: str = "FEMALE",
+        language_code: str = "en-US",
+        speaking_rate: float = 1.0
+    ) -> SynthesizedAudio:
+        """Synthesizes speech from input text and returns the audio bytes and duration in memory."""
+        pass
+
+    def synthesize_batch(
+        self,
+        texts: List[str],
+        voice_name: str = "en-US-Wavenet-F",
+        gender: str = "FEMALE",
+        language_code: str = "en-US",
+        speaking_rate: float = 1.0
+    ) -> List[SynthesizedAudio]:
+        """
+        Synthesizes several texts with the same voice, returning one audio per text in order.
+        Services that can pack texts into a single request override this; the default
+        synthesizes them one by one.
+        """
+        return [
+            self.synthesize_audio(
+                text=text,
+                voice_name=voice_name,
+                gender=gender,
+                language_code=language_code,
+                speaking_rate=speaking_rate
+            )
+            for text in texts
+        ]
+
     def synthesize_speech(
         self, 
         text: str, 
         output_filename: str, 
         voice_name: str = "en-US-Wavenet-F", 
         gender: str = "FEMALE", 
-        language_code: str = "en-US"
-    ):
-        """Synthesizes speech from input text and saves to an audio file."""
-        pass
\ No newline at end of file
+        language_code: str = "en-US",
+        speaking_rate: float = 1.0
+    ) -> float:
+        """Synthesizes speech from input text, saves it to an audio file and returns its duration in seconds."""
+        audio = self.synthesize_audio(
+            text=text,
+            voice_name=voice_name,
+            gender=gender,
+            language_code=language_code,
+            speaking_rate=speaking_rate
+        )
+        audio.save(output_filename)
+        return audio.duration
\ No newline at end of file
@@ -0,0 +1,118 @@
+import os
+import json
+import time
+from typing import Dict, List, Optional
+from google.cloud import texttospeech
+from AppConfig import AppConfig
+from GoogleTTSClientManager import GoogleTTSClientManager
+from cache.AtomicFile import AtomicFile
+
+
+class VoiceCatalog:
+    """
+    Catalog of the voices offered by Google Text-to-Speech.
+
+    The voice list is fetched once with list_voices and persisted to disk as a snapshot
+    of {"code", "name", "gender"} entries, like data/google_tts_voice_list.json. The
+    snapshot is reused until it is older than the TTL; when the service cannot be reached
+    (or the offline backend is used) the last snapshot is used whatever its age. With the
+    Google backend and no snapshot at all, the bundled voice list seeds the catalog.
+    """
+
+    def __init__(self, cache_file: Optional[str] = None, ttl: Optional[float] = None):
+        self.config = AppConfig()
+        self.cache_file = cache_file or self.config.voice_catalog_file
+        self.ttl = self.config.voice_catalog_ttl if ttl is None else ttl
+        self._voices: Optional[Dict[str, dict]] = None
+        self._loaded = False
+
+    def is_known(self) -> bool:
+        """Return True when a voice list is available to validate against."""
+        return self._load() is not None
+
+    def is_available(self, voice_name: str, language_code: str) -> bool:
+        """Return True when the voice exists for the language, or when no catalog is available."""
+        voices = self._load()
+        if voices is None:
+            return True
+        voice = voices.get(voice_name)
+        return voice is not None and language_code in voice["codes"]
+
+    def voices(self, language_code: str, gender: Optional[str] = None) -> List[str]:
+        """Return the sorted names of the voices for a language, optionally of one SSML gender."""
+        voices = self._load() or {}
+        return sorted(
+            name for name, voice in voices.items()
+            if language_code in voice["codes"] and (gender is None or voice["gender"] == gender.upper())
+        )
+
+    def _load(self) -> Optional[Dict[str, dict]]:
+        """Load the catalog once, from a fresh snapshot, the service, a stale snapshot or the bundled list in that order."""
+        if self._loaded:
+            return self._voices
+        self._loaded = True
+
+        snapshot = self._read_snapshot()
+        age = time.time() - os.path.getmtime(self.cache_file) if snapshot is not None else None
+        if snapshot is not None and (age < self.ttl or self.config.tts_backend != "google"):
+            self._voices = self._index(snapshot)
+            return self._voices
+
+        if self.config.tts_backend == "google":
+            try:
+                snapshot = self._fetch()
+                self._write_snapshot(snapshot)
+                print(f"Voice catalog: fetched {len(snapshot)} voices from Google TTS")
+            except Exception as e:
+                print(f"Voice catalog: could not fetch voices, using cached snapshot: {e}")
+                if snapshot is None:
+                    snapshot = self._read_snapshot(self.config.voice_catalog_seed_file)
+                    if snapshot is not None:
+                        print(f"Voice catalog: no snapshot at {self.cache_file}, using the bundled voice list {self.config.voice_catalog_seed_file}")
+
+        if snapshot is None:
+            print(f"Voice catalog: no snapshot at {self.cache_file}, voice names will not be validated")
+            return None
+        self._voices = self._index(snapshot)
+        return self._voices
+
+    @staticmethod
+    def _fetch() -> List[dict]:
+        """List every voice of the service as snapshot entries, one per language code."""
+        with GoogleTTSClientManager().client() as client:
+            response = client.list_voices(timeout=30)
+        return [
+            {
+                "code": code,
+                "name": voice.name,
+                "gender": texttospeech.SsmlVoiceGender(voice.ssml_gender).name,
+            }
+            for voice in response.voices
+            for code in voice.language_codes
+        ]
+
+    @staticmethod
+    def _index(snapshot: List[dict]) -> Dict[str, dict]:
+        """Index snapshot entries by voice name."""
+        voices: Dict[str, dict] = {}
+        for entry in snapshot:
+            voice = voices.setdefault(entry["name"], {"codes": set(), "gender": entry.get("gender", "")})
+            voice["codes"].add(entry["code"])
+        return voices
+
+    def _read_snapshot(self, path: Optional[str] = None) -> Optional[List[dict]]:
+        """Read the persisted snapshot (or another voice list file), or None when there is none."""
+        path = path or self.cache_file
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error loading voice catalog {path}: {e}")
+            return None
+
+    def _write_snapshot(self, snapshot: List[dict]):
+        """Persist the snapshot atomically."""
+        with AtomicFile.open(self.cache_file, "w") as f:
+            json.dump(snapshot, f)
@@ -0,0 +1,33 @@
+import io
+from pydub import AudioSegment
+from audio.AudioInfo import AudioInfo
+
+class AudioCodec:
+    """Convert synthesized audio between MP3 and LINEAR16 (WAV) bytes in memory, using ffmpeg through pydub."""
+
+    @staticmethod
+    def to_wav(audio_content: bytes, audio_encoding: str) -> bytes:
+        """Decode MP3 or WAV bytes to 16-bit WAV bytes."""
+        if audio_encoding.upper() == "LINEAR16":
+            return audio_content
+        segment = AudioSegment.from_file(io.BytesIO(audio_content), format="mp3")
+        buffer = io.BytesIO()
+        segment.set_sample_width(2).export(buffer, format="wav")
+        return buffer.getvalue()
+
+    @staticmethod
+    def from_wav(wav_content: bytes, audio_encoding: str, bitrate: str = "128k") -> bytes:
+        """Encode WAV bytes to the given encoding, MP3 or LINEAR16."""
+        if audio_encoding.upper() == "LINEAR16":
+            return wav_content
+        fmt_chunk, pcm_data = AudioInfo.split_wav(wav_content)
+        channels, sample_rate, sample_width = AudioInfo.wav_format(fmt_chunk)
+        segment = AudioSegment(
+            data=pcm_data,
+            sample_width=sample_width,
+            frame_rate=sample_rate,
+            channels=channels
+        )
+        buffer = io.BytesIO()
+        segment.export(buffer, format="mp3", bitrate=bitrate)
+        return buffer.getvalue()
\ No newline at end of file
@@ -0,0 +1,168 @@
+import struct
+from typing import List, Optional, Tuple
+
+# Bitrates in kbps indexed by [version is MPEG-1][layer][bitrate index]
+MP3_BITRATES = {
+    True: {
+        1: [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+        2: [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+        3: [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    },
+    False: {
+        1: [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+        2: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+        3: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    },
+}
+# Sample rates indexed by [version bits][sample rate index]
+MP3_SAMPLE_RATES = {
+    0b11: [44100, 48000, 32000],  # MPEG-1
+    0b10: [22050, 24000, 16000],  # MPEG-2
+    0b00: [11025, 12000, 8000],   # MPEG-2.5
+}
+# Layer bits to layer number
+MP3_LAYERS = {0b11: 1, 0b10: 2, 0b01: 3}
+
+
+class AudioInfo:
+    """Inspect, slice and join encoded audio held in memory, without touching the disk."""
+
+    @staticmethod
+    def duration(audio_content: bytes, audio_encoding: str) -> float:
+        """Return the duration in seconds of MP3 or LINEAR16 (WAV) audio bytes."""
+        if audio_encoding.upper() == "LINEAR16":
+            return AudioInfo.wav_duration(audio_content)
+        return AudioInfo.mp3_duration(audio_content)
+
+    @staticmethod
+    def mp3_duration(audio_content: bytes) -> float:
+        """Return the duration of MP3 data by walking its frame headers."""
+        data = AudioInfo.strip_id3_tags(audio_content)
+        position = 0
+        duration = 0.0
+        while position + 4 <= len(data):
+            frame = AudioInfo._parse_mp3_frame_header(data[position:position + 4])
+            if frame is None:
+                # Not a frame boundary, resynchronize on the next byte
+                position += 1
+                continue
+            frame_length, samples, sample_rate = frame
+            duration += samples / sample_rate
+            position += frame_length
+        return duration
+
+    @staticmethod
+    def wav_duration(audio_content: bytes) -> float:
+        """Return the duration of WAV data from its fmt and data chunks."""
+        fmt_chunk, pcm_data = AudioInfo.split_wav(audio_content)
+        channels, sample_rate, sample_width = AudioInfo.wav_format(fmt_chunk)
+        block_align = channels * sample_width
+        if not sample_rate or not block_align:
+            return 0.0
+        return len(pcm_data) / block_align / sample_rate
+
+    @staticmethod
+    def wav_format(fmt_chunk: bytes) -> Tuple[int, int, int]:
+        """Return (channels, sample rate, bytes per sample) from a raw WAV fmt chunk."""
+        channels, sample_rate, _, _, bits_per_sample = struct.unpack("<HIIHH", fmt_chunk[2:16])
+        return channels, sample_rate, bits_per_sample // 8
+
+    @staticmethod
+    def slice_wav(audio_content: bytes, start: float, end: Optional[float] = None) -> bytes:
+        """Return the WAV bytes between start and end seconds (end of the audio when end is None)."""
+        fmt_chunk, pcm_data = AudioInfo.split_wav(audio_content)
+        channels, sample_rate, sample_width = AudioInfo.wav_format(fmt_chunk)
+        block_align = channels * sample_width
+        start_byte = max(0, round(start * sample_rate)) * block_align
+        end_byte = len(pcm_data) if end is None else min(len(pcm_data), round(end * sample_rate) * block_align)
+        return AudioInfo.build_wav(fmt_chunk, pcm_data[start_byte:max(start_byte, end_byte)])
+
+    @staticmethod
+    def join(audio_contents: List[bytes], audio_encoding: str) -> bytes:
+        """
+        Join several audio byte strings of the same format into one.
+        MP3 frames are concatenated with the tags of later parts removed; WAV data is
+        concatenated under a single new header.
+        """
+        if audio_encoding.upper() == "LINEAR16":
+            fmt_chunk = None
+            pcm_parts = []
+            for audio_content in audio_contents:
+                part_fmt, pcm_data = AudioInfo.split_wav(audio_content)
+                fmt_chunk = fmt_chunk or part_fmt
+                pcm_parts.append(pcm_data)
+            return AudioInfo.build_wav(fmt_chunk, b"".join(pcm_parts))
+
+        return b"".join(
+            audio_content if index == 0 else AudioInfo.strip_id3_tags(audio_content)
+            for index, audio_content in enumerate(audio_contents)
+        )
+
+    @staticmethod
+    def split_wav(audio_content: bytes) -> Tuple[bytes, bytes]:
+        """Return the raw fmt chunk and the PCM data of WAV bytes."""
+        if audio_content[:4] != b"RIFF" or audio_content[8:12] != b"WAVE":
+            raise ValueError("Audio content is not a WAV file")
+
+        fmt_chunk = None
+        pcm_data = None
+        position = 12
+        while position + 8 <= len(audio_content):
+            chunk_id = audio_content[position:position + 4]
+            chunk_size = struct.unpack("<I", audio_content[position + 4:position + 8])[0]
+            body = audio_content[position + 8:position + 8 + chunk_size]
+            if chunk_id == b"fmt ":
+                fmt_chunk = body
+            elif chunk_id == b"data":
+                pcm_data = body
+            # Chunks are word aligned
+            position += 8 + chunk_size + (chunk_size & 1)
+
+        if fmt_chunk is None or pcm_data is None:
+            raise ValueError("WAV file is missing its fmt or data chunk")
+        return fmt_chunk, pcm_data
+
+    @staticmethod
+    def build_wav(fmt_chunk: bytes, pcm_data: bytes) -> bytes:
+        """Build WAV bytes from a raw fmt chunk and PCM data."""
+        return b"".join([
+            b"RIFF", struct.pack("<I", 4 + 8 + len(fmt_chunk) + 8 + len(pcm_data)), b"WAVE",
+            b"fmt ", struct.pack("<I", len(fmt_chunk)), fmt_chunk,
+            b"data", struct.pack("<I", len(pcm_data)), pcm_data,
+        ])
+
+    @staticmethod
+    def strip_id3_tags(data: bytes) -> bytes:
+        """Remove a leading ID3v2 tag and a trailing ID3v1 tag from MP3 data."""
+        if data[:3] == b"ID3" and len(data) >= 10:
+            # Tag size is a 28-bit syncsafe integer, excluding the 10-byte header and optional footer
+            size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+            footer = 10 if data[5] & 0x10 else 0
+            data = data[10 + size + footer:]
+        if len(data) >= 128 and data[-128:-125] == b"TAG":
+            data = data[:-128]
+        return data
+
+    @staticmethod
+    def _parse_mp3_frame_header(header: bytes) -> Optional[Tuple[int, int, int]]:
+        """Parse a 4-byte MPEG audio frame header into (frame length, samples, sample rate)."""
+        if header[0] != 0xFF or (header[1] & 0xE0) != 0xE0:
+            return None
+
+        version_bits = (header[1] >> 3) & 0b11
+        layer = MP3_LAYERS.get((header[1] >> 1) & 0b11)
+        bitrate_index = header[2] >> 4
+        sample_rate_index = (header[2] >> 2) & 0b11
+        padding = (header[2] >> 1) & 0b1
+        if version_bits not in MP3_SAMPLE_RATES or layer is None or bitrate_index in (0, 15) or sample_rate_index == 3:
+            return None
+
+        is_mpeg1 = version_bits == 0b11
+        bitrate = MP3_BITRATES[is_mpeg1][layer][bitrate_index] * 1000
+        sample_rate = MP3_SAMPLE_RATES[version_bits][sample_rate_index]
+
+        if layer == 1:
+            return (12 * bitrate // sample_rate + padding) * 4, 384, sample_rate
+        if layer == 3 and not is_mpeg1:
+            return 72 * bitrate // sample_rate + padding, 576, sample_rate
+        return 144 * bitrate // sample_rate + padding, 1152, sample_rate
@@ -0,0 +1,90 @@
+import numpy as np
+from TextToSpeechService import SynthesizedAudio
+from audio.AudioCodec import AudioCodec
+from audio.AudioInfo import AudioInfo
+
+# Analysis frame and similarity search window, in seconds
+FRAME_SECONDS = 0.04
+TOLERANCE_SECONDS = 0.01
+
+
+class TimeStretcher:
+    """
+    Pitch-preserving time-stretch of speech with WSOLA (waveform similarity overlap-add).
+
+    Frames are read from the input at a hop scaled by the rate and overlap-added at a
+    fixed hop; each frame is shifted within a small tolerance to the offset that best
+    continues the previous one, which keeps the pitch and avoids phasing artefacts.
+    """
+
+    @staticmethod
+    def stretch_audio(audio: SynthesizedAudio, rate: float) -> SynthesizedAudio:
+        """Return the audio played rate times faster (rate < 1 slows it down) in the same encoding."""
+        if rate == 1.0:
+            return audio
+
+        wav_content = AudioCodec.to_wav(audio.audio_content, audio.audio_encoding)
+        fmt_chunk, pcm_data = AudioInfo.split_wav(wav_content)
+        channels, sample_rate, sample_width = AudioInfo.wav_format(fmt_chunk)
+        if sample_width != 2:
+            raise ValueError(f"Time-stretch expects 16-bit PCM, got {sample_width * 8}-bit")
+
+        samples = np.frombuffer(pcm_data, dtype="<i2").reshape(-1, channels)
+        stretched = TimeStretcher.stretch(samples, rate, sample_rate)
+        pcm_data = np.clip(np.rint(stretched), -32768, 32767).astype("<i2").tobytes()
+
+        audio_content = AudioCodec.from_wav(AudioInfo.build_wav(fmt_chunk, pcm_data), audio.audio_encoding)
+        duration = AudioInfo.duration(audio_content, audio.audio_encoding)
+        print(f"Time-stretched audio by {rate:.2f}x: {audio.duration:.2f}s -> {duration:.2f}s")
+        return SynthesizedAudio(audio_content, duration, audio.audio_encoding)
+
+    @staticmethod
+    def stretch(samples: np.ndarray, rate: float, sample_rate: int) -> np.ndarray:
+        """
+        Time-stretch samples of shape (frames, channels) by rate and return float samples.
+        The output holds len(samples) / rate frames.
+        """
+        if rate <= 0:
+            raise ValueError(f"Time-stretch rate must be positive, got {rate}")
+
+        x = np.asarray(samples, dtype=np.float32)
+        if x.ndim == 1:
+            x = x[:, None]
+        output_length = int(round(len(x) / rate))
+        if rate == 1.0 or len(x) == 0:
+            return x.copy()
+
+        frame = max(2, int(sample_rate * FRAME_SECONDS) // 2 * 2)
+        synthesis_hop = frame // 2
+        analysis_hop = synthesis_hop * rate
+        tolerance = max(1, int(sample_rate * TOLERANCE_SECONDS))
+        frame_count = output_length // synthesis_hop + 2
+
+        # Pad so every candidate window and natural continuation stays inside the signal
+        mono = x.mean(axis=1)
+        padded_length = int(frame_count * analysis_hop) + 2 * tolerance + 2 * frame
+        mono = np.pad(mono, (tolerance, padded_length - len(mono)))
+        windows = np.lib.stride_tricks.sliding_window_view(mono, frame)
+
+        positions = np.empty(frame_count, dtype=np.int64)
+        positions[0] = tolerance
+        for index in range(1, frame_count):
+            # The natural continuation of the previous frame is the template to match
+            template = windows[positions[index - 1] + synthesis_hop]
+            nominal = int(round(index * analysis_hop))
+            similarity = windows[nominal:nominal + 2 * tolerance + 1] @ template
+            positions[index] = nominal + int(np.argmax(similarity))
+
+        # Overlap-add every selected frame at once, normalized by the summed window
+        window = (0.5 - 0.5 * np.cos(2 * np.pi * np.arange(frame) / frame)).astype(np.float32)
+        source = np.pad(x, ((tolerance, padded_length - len(x)), (0, 0)))
+        offsets = np.arange(frame)
+        output_index = (np.arange(frame_count) * synthesis_hop)[:, None] + offsets
+        frames = source[positions[:, None] + offsets] * window[None, :, None]
+
+        output = np.zeros((frame_count * synthesis_hop + frame, x.shape[1]), dtype=np.float32)
+        weights = np.zeros(len(output), dtype=np.float32)
+        np.add.at(output, output_index.ravel(), frames.reshape(-1, x.shape[1]))
+        np.add.at(weights, output_index.ravel(), np.broadcast_to(window, output_index.shape).ravel())
+        output /= np.maximum(weights, 1e-3)[:, None]
+        return output[:output_length]
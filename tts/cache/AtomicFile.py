@@ -0,0 +1,39 @@
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+
+
+class AtomicFile:
+    """
+    Files written through a temporary file in the same directory and renamed into place,
+    so readers never see partial files and a failed write leaves the old file untouched.
+    """
+
+    @staticmethod
+    @contextmanager
+    def open(path: str, mode: str = "wb"):
+        """Open a temporary file for writing that replaces path when the block completes without error."""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, mode) as f:
+                yield f
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    @staticmethod
+    def write(path: str, data: bytes):
+        """Write data to path atomically."""
+        with AtomicFile.open(path) as f:
+            f.write(data)
+
+    @staticmethod
+    def copy(source: str, path: str):
+        """Copy source to path atomically."""
+        with open(source, "rb") as source_file, AtomicFile.open(path) as f:
+            shutil.copyfileobj(source_file, f)
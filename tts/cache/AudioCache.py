@@ -0,0 +1,60 @@
+import json
+import struct
+import hashlib
+import unicodedata
+from typing import Optional, Tuple
+from audio.AudioInfo import AudioInfo
+from cache.AtomicFile import AtomicFile
+from cache.DiskLRUCache import DiskLRUCache
+
+
+class AudioCache(DiskLRUCache):
+    """
+    Content-addressed on-disk cache of synthesized audio.
+
+    Entries are keyed by a hash of the normalized text and the voice settings, and
+    store the audio bytes together with their measured duration. The total size is
+    bounded by a byte budget; the least recently used entries are evicted first.
+    """
+    NAME = "TTS cache"
+
+    @staticmethod
+    def make_key(text: str, voice_name: str, language_code: str, speaking_rate: float, audio_encoding: str) -> str:
+        """Build the cache key for a synthesis request."""
+        normalized_text = " ".join(unicodedata.normalize("NFC", text or "").split())
+        payload = json.dumps({
+            "text": normalized_text,
+            "voice_name": voice_name,
+            "language_code": language_code,
+            "speaking_rate": f"{float(speaking_rate):.3f}",
+            "audio_encoding": audio_encoding.upper(),
+        }, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[bytes, float]]:
+        """Return the cached (audio bytes, duration in seconds) for the key, or None on a miss."""
+        found = self._read(key, self._read_bytes)
+        if found is None:
+            return None
+        audio_content, entry = found
+        return audio_content, entry["duration"]
+
+    def put(self, key: str, audio_content: bytes, duration: float):
+        """Store audio bytes and their duration, evicting old entries to stay within budget."""
+        self._store(key, lambda path: AtomicFile.write(path, audio_content), len(audio_content), duration=duration)
+
+    def _adopt(self, path: str) -> Optional[dict]:
+        """Recover the duration of an unindexed audio file from its headers."""
+        audio_content = self._read_bytes(path)
+        audio_encoding = "LINEAR16" if audio_content[:4] == b"RIFF" else "MP3"
+        try:
+            duration = AudioInfo.duration(audio_content, audio_encoding)
+        except (ValueError, struct.error):
+            return None
+        return {"duration": duration} if duration > 0 else None
+
+    @staticmethod
+    def _read_bytes(path: str) -> bytes:
+        """Read a whole file."""
+        with open(path, "rb") as f:
+            return f.read()
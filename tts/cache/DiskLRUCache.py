@@ -0,0 +1,243 @@
+import os
+import json
+import time
+import fcntl
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+from cache.AtomicFile import AtomicFile
+
+
+class DiskLRUCache:
+    """
+    Base of the on-disk caches: one file per key plus a JSON index of entry metadata.
+
+    The total size of the files is bounded by a byte budget; the least recently used
+    entries are evicted first. Subclasses build keys and decide how entry files are
+    read and written. Entry files are read and written outside the lock, which only
+    guards the in-memory index. flush() merges the index with the one on disk under a
+    file lock, so processes sharing the directory keep each other's entries; entry
+    files missing from the index (after a run that never flushed) are adopted on load.
+    """
+    INDEX_FILE = "index.json"
+    LOCK_FILE = "index.lock"
+    FILE_SUFFIX = ".bin"
+    # Cache name used in messages
+    NAME = "cache"
+    # Puts between automatic flushes, so a crashed run loses at most this many index entries
+    FLUSH_EVERY_PUTS = 50
+    # Unindexed files that cannot be adopted are removed once they are this old
+    ORPHAN_GRACE_SECONDS = 24 * 3600
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        """
+        Initialize the cache and load its index from disk.
+
+        Args:
+            cache_dir: Directory holding the cached files and the index
+            max_bytes: Maximum total size of cached files in bytes
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()
+        self._total_bytes = 0
+        # Keys removed since the last flush, so merging does not bring them back
+        self._dropped = set()
+        self._unflushed_puts = 0
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_index()
+
+    def flush(self):
+        """
+        Merge the index with the one on disk and persist it, including the access order
+        updated by cache hits. Entries added by other processes are picked up, and the
+        merged index is evicted down to the byte budget.
+        """
+        with self._flush_lock:
+            with self._lock:
+                snapshot = {key: dict(entry) for key, entry in self._entries.items()}
+                dropped = self._dropped
+                self._dropped = set()
+                self._unflushed_puts = 0
+
+            with open(os.path.join(self.cache_dir, self.LOCK_FILE), "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    merged = self._read_index_file()
+                    for key in dropped:
+                        merged.pop(key, None)
+                    for key, entry in snapshot.items():
+                        if entry.get("last_access", 0) >= merged.get(key, {}).get("last_access", 0):
+                            merged[key] = entry
+
+                    ordered = sorted(merged.items(), key=lambda item: item[1].get("last_access", 0))
+                    total_bytes = sum(entry["size"] for _, entry in ordered)
+                    evicted = []
+                    while total_bytes > self.max_bytes and ordered:
+                        key, entry = ordered.pop(0)
+                        total_bytes -= entry["size"]
+                        evicted.append(key)
+                    self._save_index(OrderedDict(ordered))
+
+                    with self._lock:
+                        self._apply_merged(OrderedDict(ordered), snapshot, evicted)
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the current cache size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": (self.hits / lookups) if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _read(self, key: str, reader: Callable[[str], Any]) -> Optional[Tuple[Any, dict]]:
+        """Return (reader(entry file), entry metadata) for the key, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+        try:
+            result = reader(self._entry_path(key))
+        except OSError:
+            with self._lock:
+                # The file was evicted or removed behind our back, forget the entry
+                if self._entries.get(key) is entry:
+                    self._drop(key)
+                self.misses += 1
+            return None
+
+        with self._lock:
+            entry["last_access"] = time.time()
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self.hits += 1
+        return result, entry
+
+    def _store(self, key: str, writer: Callable[[str], None], size: int, **metadata):
+        """Write the entry file with writer(path) and record it, evicting old entries to stay within budget."""
+        if size > self.max_bytes:
+            return
+
+        # Writers replace the file atomically, so concurrent readers see the old or the new file
+        writer(self._entry_path(key))
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= self._entries[key]["size"]
+            self._entries[key] = dict(metadata, size=size, last_access=time.time())
+            self._entries.move_to_end(key)
+            self._dropped.discard(key)
+            self._total_bytes += size
+
+            while self._total_bytes > self.max_bytes and self._entries:
+                oldest_key = next(iter(self._entries))
+                self._drop(oldest_key)
+
+            self._unflushed_puts += 1
+            flush_due = self._unflushed_puts >= self.FLUSH_EVERY_PUTS
+
+        if flush_due:
+            self.flush()
+
+    def _adopt(self, path: str) -> Optional[dict]:
+        """Return the metadata of an unindexed entry file, or None when it cannot be recovered."""
+        return {}
+
+    def _entry_path(self, key: str) -> str:
+        """Return the path of the file for a key."""
+        return os.path.join(self.cache_dir, f"{key}{self.FILE_SUFFIX}")
+
+    def _drop(self, key: str):
+        """Remove an entry and its file. Caller must hold the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._total_bytes -= entry["size"]
+        self._dropped.add(key)
+        try:
+            os.remove(self._entry_path(key))
+        except OSError:
+            pass
+
+    def _apply_merged(self, merged: "OrderedDict[str, dict]", snapshot: dict, evicted: list):
+        """Replace the in-memory index with a merged one, keeping changes made since the snapshot. Caller must hold the lock."""
+        for key, entry in self._entries.items():
+            # Entries stored or read while the merge ran are newer than the merged ones
+            if key not in snapshot or entry.get("last_access", 0) > snapshot[key].get("last_access", 0):
+                merged[key] = entry
+        for key in self._dropped:
+            merged.pop(key, None)
+
+        self._entries = OrderedDict(sorted(merged.items(), key=lambda item: item[1].get("last_access", 0)))
+        self._total_bytes = sum(entry["size"] for entry in self._entries.values())
+        for key in evicted:
+            if key not in self._entries:
+                try:
+                    os.remove(self._entry_path(key))
+                except OSError:
+                    pass
+
+    def _load_index(self):
+        """Load the index from disk, ignoring entries whose file is gone and adopting unindexed files."""
+        entries = self._read_index_file()
+        for key, entry in sorted(entries.items(), key=lambda item: item[1].get("last_access", 0)):
+            if os.path.exists(self._entry_path(key)):
+                self._entries[key] = entry
+                self._total_bytes += entry["size"]
+
+        # Files stored by a run that ended before flushing, or by another process that has not flushed yet
+        adopted = []
+        now = time.time()
+        for name in os.listdir(self.cache_dir):
+            key, suffix = os.path.splitext(name)
+            if suffix != self.FILE_SUFFIX or key in self._entries:
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+                metadata = self._adopt(path)
+            except OSError:
+                continue
+            if metadata is not None:
+                adopted.append((key, dict(metadata, size=stat.st_size, last_access=stat.st_mtime)))
+            elif now - stat.st_mtime > self.ORPHAN_GRACE_SECONDS:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+        if adopted:
+            for key, entry in adopted:
+                self._entries[key] = entry
+                self._total_bytes += entry["size"]
+            self._entries = OrderedDict(sorted(self._entries.items(), key=lambda item: item[1].get("last_access", 0)))
+            print(f"Adopted {len(adopted)} unindexed {self.NAME} entries in {self.cache_dir}")
+
+    def _read_index_file(self) -> dict:
+        """Return the index stored on disk, or an empty one when it is missing or unreadable."""
+        index_file = os.path.join(self.cache_dir, self.INDEX_FILE)
+        if not os.path.exists(index_file):
+            return {}
+        try:
+            with open(index_file, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error loading {self.NAME} index {index_file}: {e}")
+            return {}
+
+    def _save_index(self, entries: "OrderedDict[str, dict]"):
+        """Write an index to disk. Caller must hold the index file lock."""
+        AtomicFile.write(os.path.join(self.cache_dir, self.INDEX_FILE), json.dumps(entries).encode("utf-8"))
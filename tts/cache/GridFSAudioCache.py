@@ -0,0 +1,93 @@
+import threading
+from typing import Optional, Tuple
+import gridfs
+from database.MongoDBConnection import MongoDBConnection
+
+
+class GridFSAudioCache:
+    """
+    Synthesized audio cache shared by every render host, stored in MongoDB GridFS.
+
+    Entries use the AudioCache keys as file names and keep the measured duration in the
+    file metadata, so any worker can reuse audio another worker paid for. MongoDB errors
+    are treated as misses; after a connection failure the tier is disabled for the rest
+    of the run instead of stalling every request on server selection timeouts.
+    """
+
+    def __init__(self, bucket_name: str):
+        self.bucket_name = bucket_name
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.available = True
+        self._lock = threading.Lock()
+        self._connection = MongoDBConnection()
+
+    def get(self, key: str) -> Optional[Tuple[bytes, float]]:
+        """Return the shared (audio bytes, duration in seconds) for the key, or None on a miss."""
+        bucket = self._bucket()
+        if bucket is None:
+            return None
+        try:
+            for grid_out in bucket.find({"filename": key}).sort("uploadDate", -1).limit(1):
+                audio_content = grid_out.read()
+                with self._lock:
+                    self.hits += 1
+                return audio_content, grid_out.metadata["duration"]
+        except Exception as e:
+            self._record_error("reading", e)
+            return None
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, audio_content: bytes, duration: float):
+        """Store audio bytes and their duration unless another worker already stored the key."""
+        bucket = self._bucket()
+        if bucket is None:
+            return
+        try:
+            if next(iter(bucket.find({"filename": key}).limit(1)), None) is not None:
+                return
+            bucket.upload_from_stream(key, audio_content, metadata={"duration": duration})
+        except Exception as e:
+            self._record_error("writing", e)
+
+    def flush(self):
+        """Nothing to persist, GridFS writes are immediate."""
+
+    def stats(self) -> dict:
+        """Return hit/miss/error counters of the shared tier."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": (self.hits / lookups) if lookups else 0.0,
+                "errors": self.errors,
+                "available": self.available,
+            }
+
+    def _bucket(self) -> Optional[gridfs.GridFSBucket]:
+        """
+        Return the GridFS bucket, connecting when needed.
+        The MongoDB connection is shared and other callers disconnect it after use,
+        so the connection is re-established lazily.
+        """
+        with self._lock:
+            if not self.available:
+                return None
+            try:
+                if self._connection.db is None:
+                    self._connection.connect()
+                return gridfs.GridFSBucket(self._connection.db, bucket_name=self.bucket_name)
+            except Exception as e:
+                self.available = False
+                print(f"Shared TTS cache: MongoDB unavailable, disabling the shared tier for this run: {e}")
+                return None
+
+    def _record_error(self, action: str, error: Exception):
+        """Count a failed GridFS operation."""
+        with self._lock:
+            self.errors += 1
+        print(f"Shared TTS cache: error {action} GridFS: {error}")
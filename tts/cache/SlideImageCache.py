@@ -0,0 +1,86 @@
+import os
+import json
+import shutil
+import hashlib
+from typing import Dict, Optional, Tuple
+from cache.AtomicFile import AtomicFile
+from cache.DiskLRUCache import DiskLRUCache
+
+# AppConfig fields that change how a slide looks; any change invalidates the cached images
+SLIDE_STYLE_FIELDS = (
+    "slide_renderer",
+    "slide_generation_mode_pdf",
+    "slide_batch_conversion",
+    "slide_raster_supersample",
+    "slide_raster_font_file",
+    "slide_background_normalize",
+    "slide_background_jpeg_quality",
+    "slide_title_font_size",
+    "slide_content_font_size",
+    "slide_title_font_name",
+    "slide_content_font_name",
+    "slide_content_font_color",
+    "slide_title_font_color",
+    "slide_text_background_color",
+    "enable_slide_title",
+    "activate_translation",
+)
+
+
+class SlideImageCache(DiskLRUCache):
+    """
+    Content-addressed on-disk cache of rendered slide images.
+
+    Entries are keyed by a hash of the slide text, the digests of the background and logo
+    files and every slide style setting, and store the final PNG. A hit skips both building
+    the slide and converting it. The total size is bounded by a byte budget; the least
+    recently used entries are evicted first.
+    """
+    FILE_SUFFIX = ".png"
+    NAME = "slide image cache"
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        super().__init__(cache_dir, max_bytes)
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+
+    def make_key(self, title: Optional[str], content: Optional[str], translated_content: Optional[str],
+                 background_image: Optional[str], logo_file: Optional[str], config) -> str:
+        """Build the cache key of a slide from its text, its image files and the style settings of config."""
+        payload = json.dumps({
+            "title": title or "",
+            "content": content or "",
+            "translated_content": translated_content or "",
+            "background": self.file_digest(background_image),
+            "logo": self.file_digest(logo_file),
+            "style": {field: getattr(config, field, None) for field in SLIDE_STYLE_FIELDS},
+        }, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def file_digest(self, path: Optional[str]) -> str:
+        """Return the sha256 of a file's content, memoized by path, size and modification time."""
+        if not path or not os.path.exists(path):
+            return ""
+        stat = os.stat(path)
+        memo_key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        digest = self._digests.get(memo_key)
+        if digest is None:
+            hasher = hashlib.sha256()
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    hasher.update(block)
+            digest = hasher.hexdigest()
+            self._digests[memo_key] = digest
+        return digest
+
+    def get(self, key: str, output_file: str) -> Optional[str]:
+        """Copy the cached image for the key to output_file and return it, or None on a miss."""
+        found = self._read(key, lambda path: shutil.copyfile(path, output_file))
+        return output_file if found is not None else None
+
+    def put(self, key: str, image_file: str):
+        """Store a copy of a rendered image, evicting old entries to stay within budget."""
+        try:
+            size = os.path.getsize(image_file)
+        except OSError:
+            return
+        self._store(key, lambda path: AtomicFile.copy(image_file, path), size)
@@ -0,0 +1,41 @@
+from typing import Optional, Tuple
+from cache.AudioCache import AudioCache
+from cache.GridFSAudioCache import GridFSAudioCache
+
+
+class TieredAudioCache:
+    """
+    Two-level audio cache: the local disk AudioCache in front of the fleet-wide GridFS cache.
+
+    Lookups try the local tier first; shared hits are promoted to the local tier so the
+    next lookup on this host stays local. New audio is written to both tiers.
+    """
+
+    def __init__(self, local_cache: AudioCache, shared_cache: GridFSAudioCache):
+        self.local_cache = local_cache
+        self.shared_cache = shared_cache
+
+    def get(self, key: str) -> Optional[Tuple[bytes, float]]:
+        """Return the cached (audio bytes, duration in seconds) from the nearest tier, or None on a miss."""
+        cached = self.local_cache.get(key)
+        if cached is not None:
+            return cached
+
+        cached = self.shared_cache.get(key)
+        if cached is not None:
+            self.local_cache.put(key, *cached)
+        return cached
+
+    def put(self, key: str, audio_content: bytes, duration: float):
+        """Store audio bytes and their duration in both tiers."""
+        self.local_cache.put(key, audio_content, duration)
+        self.shared_cache.put(key, audio_content, duration)
+
+    def flush(self):
+        """Flush both tiers."""
+        self.local_cache.flush()
+        self.shared_cache.flush()
+
+    def stats(self) -> dict:
+        """Return the local tier stats with the shared tier stats nested under "shared"."""
+        return dict(self.local_cache.stats(), shared=self.shared_cache.stats())
@@ -53,6 +53,12 @@ class MongoDBConnection:
             print(f"Successfully connected to MongoDB: {database}.{collection}")
         except Exception as e:
             print(f"Error connecting to MongoDB: {e}")
+            # Do not leave a half-initialized connection behind, so the next caller reconnects
+            if self.client:
+                self.client.close()
+            self.client = None
+            self.db = None
+            self.collection = None
             raise
 
     def disconnect(self) -> None:
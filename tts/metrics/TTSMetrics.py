@@ -0,0 +1,169 @@
+import json
+import threading
+from typing import Dict, Optional
+
+# Upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = [0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, float("inf")]
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram."""
+    def __init__(self):
+        self.counts = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        """Record one latency sample."""
+        for index, upper_bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= upper_bound:
+                self.counts[index] += 1
+                break
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def to_dict(self) -> dict:
+        """Return the histogram as a JSON-serializable dict."""
+        return {
+            "count": self.count,
+            "mean": (self.total / self.count) if self.count else 0.0,
+            "max": self.max,
+            "buckets": {
+                ("+Inf" if upper_bound == float("inf") else f"{upper_bound}"): count
+                for upper_bound, count in zip(LATENCY_BUCKETS, self.counts)
+            },
+        }
+
+
+class TTSMetrics:
+    """
+    Process-wide usage and latency metrics of the text-to-speech path.
+
+    Records characters billed per voice and language, request latency histograms,
+    bytes returned, failures, retries, hedged and throttled requests and cache hits
+    for one run.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        """Implement thread-safe singleton pattern."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(TTSMetrics, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """Initialize the counters if not already initialized."""
+        if self._initialized:
+            return
+        self._lock = threading.Lock()
+        self.reset()
+        self._initialized = True
+
+    def reset(self):
+        """Clear all counters, e.g. at the start of a run."""
+        with self._lock:
+            self._voices: Dict[str, dict] = {}
+            self._request_latency = LatencyHistogram()
+            self._item_latency = LatencyHistogram()
+            self._retries = 0
+            self._hedged_requests = 0
+            self._throttled_requests = 0
+            self._throttled_seconds = 0.0
+            self._cache_hits = 0
+            self._cache_misses = 0
+
+    def record_request(self, voice_name: str, language_code: str, characters: int, latency: float,
+                       audio_bytes: int = 0, success: bool = True):
+        """Record one request sent to a TTS backend."""
+        with self._lock:
+            key = f"{language_code}|{voice_name}"
+            voice = self._voices.get(key)
+            if voice is None:
+                voice = {
+                    "voice_name": voice_name,
+                    "language_code": language_code,
+                    "requests": 0,
+                    "failures": 0,
+                    "characters": 0,
+                    "audio_bytes": 0,
+                    "latency": LatencyHistogram(),
+                }
+                self._voices[key] = voice
+
+            voice["requests"] += 1
+            voice["latency"].observe(latency)
+            self._request_latency.observe(latency)
+            if success:
+                voice["characters"] += characters
+                voice["audio_bytes"] += audio_bytes
+            else:
+                voice["failures"] += 1
+
+    def record_item(self, latency: float):
+        """Record the end-to-end synthesis latency of one item, including cache and chunking."""
+        with self._lock:
+            self._item_latency.observe(latency)
+
+    def record_retry(self):
+        """Record a retried request."""
+        with self._lock:
+            self._retries += 1
+
+    def record_hedge(self):
+        """Record a hedged duplicate request."""
+        with self._lock:
+            self._hedged_requests += 1
+
+    def record_throttle(self, seconds: float):
+        """Record a request held back by the rate limiter for the given seconds."""
+        with self._lock:
+            self._throttled_requests += 1
+            self._throttled_seconds += seconds
+
+    def record_cache(self, hit: bool):
+        """Record an audio cache lookup."""
+        with self._lock:
+            if hit:
+                self._cache_hits += 1
+            else:
+                self._cache_misses += 1
+
+    def summary(self) -> dict:
+        """Return the metrics of the run as a JSON-serializable dict."""
+        with self._lock:
+            voices = [
+                dict(voice, latency=voice["latency"].to_dict())
+                for voice in self._voices.values()
+            ]
+            cache_lookups = self._cache_hits + self._cache_misses
+            return {
+                "requests": sum(voice["requests"] for voice in voices),
+                "failures": sum(voice["failures"] for voice in voices),
+                "characters": sum(voice["characters"] for voice in voices),
+                "audio_bytes": sum(voice["audio_bytes"] for voice in voices),
+                "retries": self._retries,
+                "hedged_requests": self._hedged_requests,
+                "throttled_requests": self._throttled_requests,
+                "throttled_seconds": self._throttled_seconds,
+                "cache": {
+                    "hits": self._cache_hits,
+                    "misses": self._cache_misses,
+                    "hit_ratio": (self._cache_hits / cache_lookups) if cache_lookups else 0.0,
+                },
+                "request_latency": self._request_latency.to_dict(),
+                "item_latency": self._item_latency.to_dict(),
+                "voices": voices,
+            }
+
+    def save(self, output_file: str, extra: Optional[dict] = None) -> dict:
+        """Write the summary, merged with optional extra fields, to a JSON file and return it."""
+        data = dict(extra or {})
+        data.update(self.summary())
+        with open(output_file, "w") as f:
+            json.dump(data, f, indent=4)
+        return data
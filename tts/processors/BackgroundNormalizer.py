@@ -0,0 +1,99 @@
+import os
+import hashlib
+from typing import Dict, Optional, Tuple
+from PIL import Image
+from AppConfig import AppConfig
+from cache.AtomicFile import AtomicFile
+
+# Pixel size of a slide in the videos
+SLIDE_SIZE = (1920, 1080)
+
+
+class BackgroundNormalizer:
+    """
+    Scale slide backgrounds larger than the slide's pixel size down once and re-encode them as JPEG.
+
+    The normalized file is cached on disk under the digest of the source file, so a
+    background is decoded and scaled once, however many slides and documents use it.
+    Slides embed or draw the small normalized file instead of the full-resolution source.
+    """
+
+    def __init__(self):
+        self.config = AppConfig()
+        self.output_dir = self.config.slide_background_dir
+        self.size = (SLIDE_SIZE[0] * self.config.slide_raster_supersample, SLIDE_SIZE[1] * self.config.slide_raster_supersample)
+        self._normalized: Dict[Tuple[str, int, int], str] = {}
+
+    def normalize(self, background_image: Optional[str]) -> Optional[str]:
+        """Return the normalized file for a background image, or the source when it cannot be normalized."""
+        if not (background_image and os.path.exists(background_image)):
+            return background_image
+
+        stat = os.stat(background_image)
+        memo_key = (os.path.abspath(background_image), stat.st_size, stat.st_mtime_ns)
+        normalized_file = self._normalized.get(memo_key)
+        if normalized_file is not None:
+            return normalized_file
+
+        try:
+            with Image.open(background_image) as background:
+                target_size = self._target_size(background.size)
+        except OSError as e:
+            print(f"Error reading background {background_image}: {e}")
+            return background_image
+        if target_size is None:
+            # Not larger than the slide and of the same aspect: scaling would only add bytes and blur
+            self._normalized[memo_key] = background_image
+            return background_image
+
+        digest = self._file_digest(background_image)
+        width, height = target_size
+        normalized_file = os.path.join(self.output_dir, f"{digest}_{width}x{height}.jpg")
+        if not os.path.exists(normalized_file):
+            try:
+                self._write_normalized(background_image, normalized_file, target_size)
+            except OSError as e:
+                print(f"Error normalizing background {background_image}: {e}")
+                return background_image
+            print(f"Normalized background {background_image} to {normalized_file}")
+
+        self._normalized[memo_key] = normalized_file
+        return normalized_file
+
+    def _target_size(self, source_size: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """
+        Return the size to scale a background to, or None when the source can be used as is.
+        Larger sources are scaled down to the slide size; smaller ones of another aspect ratio
+        are scaled to the slide's aspect ratio without upscaling.
+        """
+        source_width, source_height = source_size
+        width, height = self.size
+        if source_width > width or source_height > height:
+            return self.size
+        if abs(source_width * height - source_height * width) <= width:
+            return None
+        if source_width * height > source_height * width:
+            return round(source_height * width / height), source_height
+        return source_width, round(source_width * height / width)
+
+    def _write_normalized(self, background_image: str, normalized_file: str, target_size: Tuple[int, int]):
+        """Decode, scale and re-encode a background, written atomically and readable like other outputs."""
+        with Image.open(background_image) as background:
+            # Slides stretch the background over the whole slide, so the aspect ratio is not kept
+            image = background.convert("RGB")
+            if image.size != target_size:
+                image = image.resize(target_size, Image.LANCZOS)
+
+        with AtomicFile.open(normalized_file) as f:
+            image.save(f, "JPEG", quality=self.config.slide_background_jpeg_quality, optimize=True)
+        # The temporary file behind AtomicFile is created with mode 0600
+        os.chmod(normalized_file, 0o644)
+
+    @staticmethod
+    def _file_digest(path: str) -> str:
+        """Return the sha256 of a file's content."""
+        hasher = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                hasher.update(block)
+        return hasher.hexdigest()
@@ -0,0 +1,194 @@
+import os
+import time
+import atexit
+import shutil
+import threading
+import subprocess
+from typing import Optional
+from AppConfig import AppConfig
+
+try:
+    # Python-UNO bridge, shipped with LibreOffice (python3-uno on Debian/Ubuntu)
+    import uno
+    from com.sun.star.beans import PropertyValue
+except ImportError:
+    uno = None
+
+# Impress export filters by target format
+EXPORT_FILTERS = {
+    "pdf": "impress_pdf_Export",
+    "png": "impress_png_Export",
+}
+
+
+class OfficeConverter:
+    """
+    Long-lived headless LibreOffice that converts slides over a per-process UNO pipe.
+
+    The office process is started once with --accept and kept warm, so a conversion costs
+    a document load and export instead of a full LibreOffice cold start. Each conversion
+    runs under a watchdog: when it exceeds the timeout, or the process has died, the
+    office is killed and restarted and the call reports failure so the caller can fall
+    back to a one-shot soffice run. Without the UNO bridge the converter is unavailable.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        """Implement thread-safe singleton pattern."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(OfficeConverter, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """Read the converter settings if not already initialized; the office starts on first use."""
+        with self._instance_lock:
+            if self._initialized:
+                return
+
+            self.config = AppConfig()
+            self.binary = self.config.libreoffice_binary
+            self.timeout = self.config.libreoffice_convert_timeout
+            self.startup_timeout = self.config.libreoffice_startup_timeout
+            # Per-process pipe and profile: a shared profile would make a second generator's soffice
+            # hand its work to this office and exit, and one-shot fallbacks never attach to it either
+            self.pipe_name = f"tts_office_{os.getpid()}"
+            self.connection = f"pipe,name={self.pipe_name}"
+            self.profile_dir = os.path.join(self.config.temp_dir, f"libreoffice_profile_{os.getpid()}")
+
+            self._lock = threading.Lock()
+            self._process: Optional[subprocess.Popen] = None
+            self._desktop = None
+            self.available = uno is not None and shutil.which(self.binary) is not None
+            if uno is None:
+                print("LibreOffice UNO bridge not available, slides are converted with one soffice run each")
+
+            atexit.register(self.close)
+            self._initialized = True
+
+    def convert(self, input_file: str, target_format: str, output_dir: str) -> Optional[str]:
+        """
+        Convert input_file to target_format ('pdf' or 'png') in output_dir.
+        Returns the converted file path, or None when the persistent office could not convert it.
+        """
+        if not self.available:
+            return None
+
+        base_name = os.path.splitext(os.path.basename(input_file))[0]
+        output_file = os.path.join(output_dir, f"{base_name}.{target_format}")
+
+        with self._lock:
+            try:
+                desktop = self._ensure_started()
+            except Exception as e:
+                print(f"LibreOffice: could not start persistent office: {e}")
+                self._kill()
+                return None
+
+            result = {}
+            worker = threading.Thread(
+                target=self._export,
+                args=(desktop, os.path.abspath(input_file), os.path.abspath(output_file), target_format, result),
+                daemon=True
+            )
+            start = time.monotonic()
+            worker.start()
+            worker.join(self.timeout)
+
+            if worker.is_alive():
+                print(f"LibreOffice: converting {input_file} exceeded {self.timeout}s, restarting office")
+                self._kill()
+                return None
+            if "error" in result:
+                print(f"LibreOffice: error converting {input_file}: {result['error']}")
+                # A broken bridge usually means the office died; start fresh next time
+                self._kill()
+                return None
+
+        print(f"LibreOffice: converted {os.path.basename(input_file)} to {target_format} in {time.monotonic() - start:.2f}s")
+        return output_file if os.path.exists(output_file) else None
+
+    def close(self):
+        """Terminate the office process and remove its profile."""
+        with self._lock:
+            if self._desktop is not None:
+                try:
+                    self._desktop.terminate()
+                except Exception:
+                    pass
+            self._kill()
+        shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+    @staticmethod
+    def _export(desktop, input_file: str, output_file: str, target_format: str, result: dict):
+        """Load, export and close one document; runs on the watchdog's worker thread."""
+        try:
+            document = desktop.loadComponentFromURL(
+                uno.systemPathToFileUrl(input_file), "_blank", 0,
+                (OfficeConverter._property("Hidden", True),)
+            )
+            try:
+                document.storeToURL(
+                    uno.systemPathToFileUrl(output_file),
+                    (OfficeConverter._property("FilterName", EXPORT_FILTERS[target_format]),)
+                )
+            finally:
+                document.close(True)
+        except Exception as e:
+            result["error"] = e
+
+    @staticmethod
+    def _property(name: str, value):
+        """Build a UNO PropertyValue."""
+        prop = PropertyValue()
+        prop.Name = name
+        prop.Value = value
+        return prop
+
+    def _ensure_started(self):
+        """Return the office Desktop, starting the office and connecting to it when needed. Caller must hold the lock."""
+        if self._process is not None and self._process.poll() is None and self._desktop is not None:
+            return self._desktop
+        self._kill()
+
+        os.makedirs(self.profile_dir, exist_ok=True)
+        self._process = subprocess.Popen([
+            self.binary,
+            "--headless",
+            "--invisible",
+            "--nologo",
+            "--nodefault",
+            "--norestore",
+            f"-env:UserInstallation={uno.systemPathToFileUrl(os.path.abspath(self.profile_dir))}",
+            f"--accept={self.connection};urp;StarOffice.ComponentContext",
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext("com.sun.star.bridge.UnoUrlResolver", local_context)
+        deadline = time.monotonic() + self.startup_timeout
+        while True:
+            try:
+                context = resolver.resolve(f"uno:{self.connection};urp;StarOffice.ComponentContext")
+                break
+            except Exception:
+                if self._process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError(f"office did not accept connections on pipe {self.pipe_name}")
+                time.sleep(0.25)
+
+        self._desktop = context.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", context)
+        print(f"LibreOffice: persistent office started on pipe {self.pipe_name}")
+        return self._desktop
+
+    def _kill(self):
+        """Kill the office process, if any. Caller must hold the lock."""
+        self._desktop = None
+        if self._process is not None:
+            if self._process.poll() is None:
+                self._process.kill()
+                try:
+                    self._process.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    pass
+            self._process = None
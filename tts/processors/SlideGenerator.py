@@ -1,5 +1,7 @@
+import io
 import os
-from typing import Optional
+from copy import deepcopy
+from typing import Dict, List, Optional
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
@@ -10,42 +12,207 @@ from pptx.oxml.xmlchemy import OxmlElement
 from pptx.util import Cm
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.oxml import parse_xml
-from pptx.oxml.ns import nsdecls
+from pptx.oxml.ns import nsdecls, qn
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from AppConfig import AppConfig
+from processors.BackgroundNormalizer import BackgroundNormalizer
+
+# Names of the template shapes filled in per slide
+CONTENT_SHAPE_NAME = "Content"
+TRANSLATED_CONTENT_SHAPE_NAME = "Translated Content"
+LOGO_SHAPE_NAME = "Logo"
+
+# Fill elements removed before a gradient is applied
+FILL_TAGS = ('a:noFill', 'a:solidFill', 'a:gradFill', 'a:blipFill', 'a:pattFill')
+
+# Precompiled shape fragments, deep-copied into each shape instead of being re-parsed
+# Explicit outer shadow with 0% opacity (invisible shadow)
+NO_SHADOW = parse_xml(f'''
+<a:effectLst {nsdecls('a')}>
+<a:outerShdw blurRad="40000" dist="20000" dir="5400000" algn="ctr" rotWithShape="0">
+    <a:srgbClr val="000000">
+    <a:alpha val="0"/>
+    </a:srgbClr>
+</a:outerShdw>
+</a:effectLst>
+''')
+
+# Bottom band: opaque black at the bottom fading to transparent at the top
+GRADIENT_BOTTOM = parse_xml(f'''
+<a:gradFill rotWithShape="0" {nsdecls('a')}>
+<a:gsLst>
+    <a:gs pos="100000">
+    <a:srgbClr val="060606">
+        <a:alpha val="0"/>
+    </a:srgbClr>
+    </a:gs>
+    <a:gs pos="0">
+    <a:srgbClr val="000000">
+        <a:alpha val="100000"/>
+    </a:srgbClr>
+    </a:gs>
+</a:gsLst>
+<a:lin ang="16200000" scaled="1"/>
+</a:gradFill>
+''')
+
+# Top band: opaque black at the top fading to transparent at the bottom
+GRADIENT_TOP = parse_xml(f'''
+<a:gradFill rotWithShape="0" {nsdecls('a')}>
+<a:gsLst>
+    <a:gs pos="0">
+    <a:srgbClr val="000000">
+        <a:alpha val="0"/>
+    </a:srgbClr>
+    </a:gs>
+    <a:gs pos="100000">
+    <a:srgbClr val="060606">
+        <a:alpha val="100000"/>
+    </a:srgbClr>
+    </a:gs>
+</a:gsLst>
+<a:lin ang="16200000" scaled="1"/>
+</a:gradFill>
+''')
+
+# Title: opaque black on the left fading to transparent on the right
+GRADIENT_TITLE = parse_xml(f'''
+<a:gradFill rotWithShape="0" {nsdecls('a')}>
+<a:gsLst>
+    <a:gs pos="0">
+    <a:srgbClr val="060606">
+        <a:alpha val="0"/>
+    </a:srgbClr>
+    </a:gs>
+    <a:gs pos="100000">
+    <a:srgbClr val="000000">
+        <a:alpha val="100000"/>
+    </a:srgbClr>
+    </a:gs>
+</a:gsLst>
+<a:lin ang="10800000" scaled="1"/>
+</a:gradFill>
+''')
 
 class SlideGenerator:
     def __init__(self):
         self.slide_width = Inches(13.33)
         self.slide_height = Inches(7.5)
         self.config = AppConfig()
+        # Serialized single-slide templates per background image
+        self._templates: Dict[Optional[str], bytes] = {}
+        self.background_normalizer = BackgroundNormalizer() if self.config.slide_background_normalize else None
 
     def create_slide(self, title: str, content: str, background_image: str, output_file: str, translated_content: Optional[str] = None) -> str:
         """Create a slide with the given content and return the file path."""
+        # Clone the document's template, which already holds the background, text bands and logo
+        presentation = Presentation(io.BytesIO(self._get_template(background_image)))
+        self._fill_slide(presentation.slides[0], title, content, translated_content)
+
+        # Save presentation
+        presentation.save(output_file)
+        return output_file
+
+    def create_deck(self, slides: List[dict], background_image: str, output_file: str) -> str:
+        """
+        Create one presentation holding a slide per entry of slides, in order, and return the file path.
+        Each entry has the title, content and translated_content arguments of create_slide.
+        """
+        presentation = Presentation(io.BytesIO(self._get_template(background_image)))
+        template_slide = presentation.slides[0]
+        blank_layout = presentation.slide_layouts[6]  # Layout 6 is blank
+
+        for entry in slides:
+            slide = presentation.slides.add_slide(blank_layout)
+            self._copy_shapes(template_slide, slide)
+            self._fill_slide(slide, entry.get("title"), entry.get("content"), entry.get("translated_content"))
+
+        # Drop the template slide itself
+        slide_ids = presentation.slides._sldIdLst
+        template_slide_id = slide_ids[0]
+        presentation.part.drop_rel(template_slide_id.rId)
+        slide_ids.remove(template_slide_id)
+
+        presentation.save(output_file)
+        return output_file
+
+    def _fill_slide(self, slide, title: str, content: str, translated_content: Optional[str]):
+        """Fill a slide cloned from the template with its text, dropping the bands that stay empty."""
+        shapes = {shape.name: shape for shape in slide.shapes}
+
+        content_shape = shapes[CONTENT_SHAPE_NAME]
+        if content:
+            self._add_paragraphs(content_shape.text_frame, content)
+        else:
+            self._remove_shape(content_shape)
+
+        translated_shape = shapes.get(TRANSLATED_CONTENT_SHAPE_NAME)
+        if translated_shape is not None:
+            if translated_content:
+                self._add_paragraphs(translated_shape.text_frame, translated_content)
+            else:
+                self._remove_shape(translated_shape)
+
+        if title and self.config.enable_slide_title:
+            self._add_title(slide, title, before=shapes.get(LOGO_SHAPE_NAME))
+
+    @staticmethod
+    def _copy_shapes(source_slide, target_slide):
+        """Copy every shape of source_slide onto target_slide, re-linking the pictures they embed."""
+        # Relate the target slide to the same image parts and map the relationship ids
+        rel_ids = {}
+        for rel_id, rel in source_slide.part.rels.items():
+            if rel.reltype == RT.IMAGE:
+                rel_ids[rel_id] = target_slide.part.relate_to(rel.target_part, rel.reltype)
+
+        target_tree = target_slide.shapes._spTree
+        for element in source_slide.shapes._spTree.iterchildren():
+            if element.tag.endswith("}nvGrpSpPr") or element.tag.endswith("}grpSpPr"):
+                continue
+            element = deepcopy(element)
+            for blip in element.iter(qn("a:blip")):
+                embed = blip.get(qn("r:embed"))
+                if embed in rel_ids:
+                    blip.set(qn("r:embed"), rel_ids[embed])
+            target_tree.append(element)
+
+    def _get_template(self, background_image: Optional[str]) -> bytes:
+        """Return the serialized template for a background image, building it on first use."""
+        if not (background_image and os.path.exists(background_image)):
+            background_image = None
+        template = self._templates.get(background_image)
+        if template is None:
+            if background_image and self.background_normalizer is not None:
+                # Embed the background scaled to the slide size instead of the full-resolution source
+                template = self._build_template(self.background_normalizer.normalize(background_image))
+            else:
+                template = self._build_template(background_image)
+            self._templates[background_image] = template
+        return template
+
+    def _build_template(self, background_image: Optional[str]) -> bytes:
+        """Build a one-slide presentation with every shape that does not depend on the slide text."""
         presentation = Presentation()
         presentation.slide_width = self.slide_width
         presentation.slide_height = self.slide_height
 
         # Create a blank slide
         slide = presentation.slides.add_slide(presentation.slide_layouts[6])  # Layout 6 is blank
-        
+
         # Add background if exists
-        if background_image and os.path.exists(background_image):
+        if background_image:
             self._add_background(slide, background_image)
 
-        # Add content
-        if content:
-            self._add_content(slide, content)
-        if translated_content and self.config.activate_translation:
-            self._add_translated_content(slide, translated_content)
-        if title and self.config.enable_slide_title:
-            self._add_title(slide, title)
+        self._add_content(slide)
+        if self.config.activate_translation:
+            self._add_translated_content(slide)
 
         # Add logo to the top right
         self._add_logo(slide)
 
-        # Save presentation
-        presentation.save(output_file)
-        return output_file
+        buffer = io.BytesIO()
+        presentation.save(buffer)
+        return buffer.getvalue()
 
     def _add_background(self, slide, background_image: str):
         """Add background image to slide."""
@@ -58,8 +225,8 @@ class SlideGenerator:
         slide.shapes._spTree.remove(background_shape._element)
         slide.shapes._spTree.insert(2, background_shape._element)
 
-    def _add_title(self, slide, title: str):
-        """Add title to slide."""
+    def _add_title(self, slide, title: str, before=None):
+        """Add title to slide, below the shape given in before (the logo) when there is one."""
         # Create a new shape for title with initial dimensions
         title_shape = slide.shapes.add_shape(
             MSO_SHAPE.RECTANGLE,  # Using regular rectangle
@@ -68,14 +235,11 @@ class SlideGenerator:
             Inches(0.1),  # Initial width, will be adjusted
             Inches(0.1)  # Initial height, will be adjusted
         )
+        if before is not None:
+            before._element.addprevious(title_shape._element)
         
         # Set transparent border
-        title_shape.line.fill.solid()
-        title_shape.line.fill.fore_color.rgb = RGBColor(*self.config.slide_text_background_color)
-        title_shape.line.width = Pt(1)  # 1 point width
-        if hasattr(title_shape.line.fill._xPr, 'solidFill'):
-            srgbClr = title_shape.line.fill._xPr.solidFill.srgbClr
-            self.SubElement(srgbClr, 'a:alpha', val='0')  # 0% opacity (completely transparent)
+        self._set_transparent_border(title_shape)
         
         # Set text frame properties
         text_frame = title_shape.text_frame
@@ -109,13 +273,10 @@ class SlideGenerator:
         title_shape.height = Inches(text_height) + Inches(0.4)  # Add padding for margins
         title_shape.width = Inches(text_width) + Inches(1.0)  # Add padding for margins
 
-        #title_shape.fill.solid()
-        #title_shape.fill.fore_color.rgb = RGBColor(*self.config.slide_text_background_color)  # Background color
         self._set_shape_transparency_v3(title_shape, '0', angle='13440000', trans_angle='8100000')  # Fill: 0 degrees, Transparency: 135 degrees
-    
 
-    def _add_content(self, slide, content: str):
-        """Add content to slide."""
+    def _add_content(self, slide):
+        """Add the empty content band at the bottom of the slide."""
         # Create a new shape for content at the bottom
         content_shape = slide.shapes.add_shape(
             MSO_SHAPE.RECTANGLE,  # Using regular rectangle
@@ -124,14 +285,10 @@ class SlideGenerator:
             self.slide_width,  # Full width
             Inches(3)  # Height
         )
+        content_shape.name = CONTENT_SHAPE_NAME
         
         # Set transparent border
-        content_shape.line.fill.solid()
-        content_shape.line.fill.fore_color.rgb = RGBColor(*self.config.slide_text_background_color)
-        content_shape.line.width = Pt(1)  # 1 point width
-        if hasattr(content_shape.line.fill._xPr, 'solidFill'):
-            srgbClr = content_shape.line.fill._xPr.solidFill.srgbClr
-            self.SubElement(srgbClr, 'a:alpha', val='0')  # 0% opacity (completely transparent)
+        self._set_transparent_border(content_shape)
         
         # Set text frame properties
         text_frame = content_shape.text_frame
@@ -143,27 +300,10 @@ class SlideGenerator:
         text_frame.margin_bottom = Inches(0.2)
         text_frame.vertical_anchor = MSO_ANCHOR.BOTTOM  # Center vertically
 
-        #content_shape.fill.solid()
-        #content_shape.fill.fore_color.rgb = RGBColor(*self.config.slide_text_background_color)  # Background color
         self._set_shape_transparency_bottom(content_shape, '0', angle='21600000', trans_angle='10800000')  # Fill: 0 degrees, Transparency: 180 degrees
-        
-
-        # Process content to ensure left-aligned line-by-line formatting
-        content_lines = [line.strip() for line in content.split("\n") if line.strip()]
-
-        for line in content_lines:
-            p = text_frame.add_paragraph()
-            p.text = line
-            p.font.name = self.config.slide_content_font_name
-            p.font.color.rgb = RGBColor(*self.config.slide_content_font_color)
-            p.font.size = Pt(self.config.slide_content_font_size)
-            p.alignment = PP_ALIGN.CENTER  # Center horizontally
 
-            # Remove bullet points and align text properly
-            p._pPr.insert(0, etree.Element("{http://schemas.openxmlformats.org/drawingml/2006/main}buNone"))
-
-    def _add_translated_content(self, slide, translated_content: str):
-        """Add translated content to the top of the slide, opposite to the main content, with gradient effect."""
+    def _add_translated_content(self, slide):
+        """Add the empty translated content band at the top of the slide, opposite to the main content, with gradient effect."""
         # Create a new shape for translated content at the top
         translated_shape = slide.shapes.add_shape(
             MSO_SHAPE.RECTANGLE,  # Using regular rectangle
@@ -172,14 +312,10 @@ class SlideGenerator:
             self.slide_width,  # Full width
             Inches(3)  # Height
         )
+        translated_shape.name = TRANSLATED_CONTENT_SHAPE_NAME
 
         # Set transparent border
-        translated_shape.line.fill.solid()
-        translated_shape.line.fill.fore_color.rgb = RGBColor(*self.config.slide_text_background_color)
-        translated_shape.line.width = Pt(1)  # 1 point width
-        if hasattr(translated_shape.line.fill._xPr, 'solidFill'):
-            srgbClr = translated_shape.line.fill._xPr.solidFill.srgbClr
-            self.SubElement(srgbClr, 'a:alpha', val='0')  # 0% opacity (completely transparent)
+        self._set_transparent_border(translated_shape)
 
         # Set text frame properties
         text_frame = translated_shape.text_frame
@@ -194,8 +330,10 @@ class SlideGenerator:
         # Apply gradient transparency effect (top style)
         self._set_shape_transparency_top(translated_shape, '0', angle='10800000', trans_angle='5400000')  # Fill: 0 degrees, Transparency: 90 degrees
 
-        # Process translated content to ensure left-aligned line-by-line formatting
-        content_lines = [line.strip() for line in translated_content.split("\n") if line.strip()]
+    def _add_paragraphs(self, text_frame, text: str):
+        """Add one centered paragraph per non-empty line of text, without bullets."""
+        # Process content to ensure left-aligned line-by-line formatting
+        content_lines = [line.strip() for line in text.split("\n") if line.strip()]
 
         for line in content_lines:
             p = text_frame.add_paragraph()
@@ -208,11 +346,9 @@ class SlideGenerator:
             # Remove bullet points and align text properly
             p._pPr.insert(0, etree.Element("{http://schemas.openxmlformats.org/drawingml/2006/main}buNone"))
 
-
     def _add_logo(self, slide):
         """Add a small logo to the top right of the slide."""
-        logo_path = os.path.join(os.path.dirname(__file__), "..", "logo", "logo-nobg-2.png")
-        logo_path = os.path.abspath(logo_path)
+        logo_path = self.config.slide_logo_file
         if not os.path.exists(logo_path):
             print(f"Logo file not found: {logo_path}")
             return
@@ -222,17 +358,32 @@ class SlideGenerator:
         margin = Inches(3)
         left = self.slide_width - logo_width - margin
         top = margin
-        slide.shapes.add_picture(logo_path, left, top, width=logo_width, height=logo_height)
-
+        logo_shape = slide.shapes.add_picture(logo_path, left, top, width=logo_width, height=logo_height)
+        logo_shape.name = LOGO_SHAPE_NAME
+
+    @staticmethod
+    def _remove_shape(shape):
+        """Remove a shape from its slide."""
+        element = shape._element
+        element.getparent().remove(element)
+
+    def _set_transparent_border(self, shape):
+        """Give the shape a 1 pt border in the text background color at 0% opacity."""
+        shape.line.fill.solid()
+        shape.line.fill.fore_color.rgb = RGBColor(*self.config.slide_text_background_color)
+        shape.line.width = Pt(1)  # 1 point width
+        if hasattr(shape.line.fill._xPr, 'solidFill'):
+            srgbClr = shape.line.fill._xPr.solidFill.srgbClr
+            self.SubElement(srgbClr, 'a:alpha', val='0')  # 0% opacity (completely transparent)
 
     def SubElement(self, parent, tagname, **kwargs):
         element = OxmlElement(tagname)
         element.attrib.update(kwargs)
         parent.append(element)
         return element
-    
-    def _set_shape_transparency_bottom(self, shape, alpha, angle='16200000', trans_angle='16200000'):
 
+    def _apply_gradient(self, shape, gradient):
+        """Replace the shape's fill and effects with the invisible shadow and a precompiled gradient."""
         sp = shape._element
 
         # Access or create the <p:spPr> element (shape properties)
@@ -241,160 +392,23 @@ class SlideGenerator:
             spPr = parse_xml('<p:spPr xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"/>')
             sp.append(spPr)
 
-        # Remove any existing fill elements
-        for tag in ('a:noFill', 'a:solidFill', 'a:gradFill', 'a:blipFill', 'a:pattFill'):
+        # Remove any existing fill elements and effects
+        for tag in FILL_TAGS + ('a:effectLst',):
             element = spPr.find(f"./{tag}", namespaces={'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'})
             if element is not None:
                 spPr.remove(element)
 
-        # Remove shadow (disable effects)
-        # Remove existing effectLst if present
-        effectLst = spPr.find('./a:effectLst', namespaces={'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'})
-        if effectLst is not None:
-            spPr.remove(effectLst)
-
-        # Add explicit outer shadow with 0% opacity (invisible shadow)
-        no_shadow_xml = '''
-        <a:effectLst xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">
-        <a:outerShdw blurRad="40000" dist="20000" dir="5400000" algn="ctr" rotWithShape="0">
-            <a:srgbClr val="000000">
-            <a:alpha val="0"/>
-            </a:srgbClr>
-        </a:outerShdw>
-        </a:effectLst>
-        '''
-        spPr.append(parse_xml(no_shadow_xml))
-
-
-        # Define and insert gradient XML
-        gradient_xml = f'''
-        <a:gradFill rotWithShape="0" {nsdecls('a')}>
-        <a:gsLst>
-            <a:gs pos="100000">
-            <a:srgbClr val="060606">
-                <a:alpha val="0"/>
-            </a:srgbClr>
-            </a:gs>
-            <a:gs pos="0">
-            <a:srgbClr val="000000">
-                <a:alpha val="100000"/>
-            </a:srgbClr>
-            </a:gs>
-        </a:gsLst>
-        <a:lin ang="16200000" scaled="1"/>
-        </a:gradFill>
-        '''
-        spPr.append(parse_xml(gradient_xml))
+        spPr.append(deepcopy(NO_SHADOW))
+        spPr.append(deepcopy(gradient))
+    
+    def _set_shape_transparency_bottom(self, shape, alpha, angle='16200000', trans_angle='16200000'):
+        self._apply_gradient(shape, GRADIENT_BOTTOM)
 
     def _set_shape_transparency_top(self, shape, alpha, angle='16200000', trans_angle='16200000'):
-
-        sp = shape._element
-
-        # Access or create the <p:spPr> element (shape properties)
-        spPr = sp.find("./p:spPr", namespaces={'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'})
-        if spPr is None:
-            spPr = parse_xml('<p:spPr xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"/>')
-            sp.append(spPr)
-
-        # Remove any existing fill elements
-        for tag in ('a:noFill', 'a:solidFill', 'a:gradFill', 'a:blipFill', 'a:pattFill'):
-            element = spPr.find(f"./{tag}", namespaces={'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'})
-            if element is not None:
-                spPr.remove(element)
-
-        # Remove shadow (disable effects)
-        # Remove existing effectLst if present
-        effectLst = spPr.find('./a:effectLst', namespaces={'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'})
-        if effectLst is not None:
-            spPr.remove(effectLst)
-
-        # Add explicit outer shadow with 0% opacity (invisible shadow)
-        no_shadow_xml = '''
-        <a:effectLst xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">
-        <a:outerShdw blurRad="40000" dist="20000" dir="5400000" algn="ctr" rotWithShape="0">
-            <a:srgbClr val="000000">
-            <a:alpha val="0"/>
-            </a:srgbClr>
-        </a:outerShdw>
-        </a:effectLst>
-        '''
-        spPr.append(parse_xml(no_shadow_xml))
-
-
-        # Define and insert gradient XML
-        gradient_xml = f'''
-        <a:gradFill rotWithShape="0" {nsdecls('a')}>
-        <a:gsLst>
-            <a:gs pos="0">
-            <a:srgbClr val="000000">
-                <a:alpha val="0"/>
-            </a:srgbClr>
-            </a:gs>
-            <a:gs pos="100000">
-            <a:srgbClr val="060606">
-                <a:alpha val="100000"/>
-            </a:srgbClr>
-            </a:gs>
-        </a:gsLst>
-        <a:lin ang="16200000" scaled="1"/>
-        </a:gradFill>
-        '''
-        spPr.append(parse_xml(gradient_xml))
+        self._apply_gradient(shape, GRADIENT_TOP)
 
     def _set_shape_transparency_v3(self, shape, alpha, angle='16200000', trans_angle='16200000'):
-    
-        sp = shape._element
-
-        # Access or create the <p:spPr> element (shape properties)
-        spPr = sp.find("./p:spPr", namespaces={'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'})
-        if spPr is None:
-            spPr = parse_xml('<p:spPr xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"/>')
-            sp.append(spPr)
-
-        # Remove any existing fill elements
-        for tag in ('a:noFill', 'a:solidFill', 'a:gradFill', 'a:blipFill', 'a:pattFill'):
-            element = spPr.find(f"./{tag}", namespaces={'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'})
-            if element is not None:
-                spPr.remove(element)
-
-        # Remove shadow (disable effects)
-        # Remove existing effectLst if present
-        effectLst = spPr.find('./a:effectLst', namespaces={'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'})
-        if effectLst is not None:
-            spPr.remove(effectLst)
-
-        # Add explicit outer shadow with 0% opacity (invisible shadow)
-        no_shadow_xml = '''
-        <a:effectLst xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">
-        <a:outerShdw blurRad="40000" dist="20000" dir="5400000" algn="ctr" rotWithShape="0">
-            <a:srgbClr val="000000">
-            <a:alpha val="0"/>
-            </a:srgbClr>
-        </a:outerShdw>
-        </a:effectLst>
-        '''
-        spPr.append(parse_xml(no_shadow_xml))
-
-
-        # Define and insert gradient XML
-        gradient_xml = f'''
-        <a:gradFill rotWithShape="0" {nsdecls('a')}>
-        <a:gsLst>
-            <a:gs pos="0">
-            <a:srgbClr val="060606">
-                <a:alpha val="0"/>
-            </a:srgbClr>
-            </a:gs>
-            <a:gs pos="100000">
-            <a:srgbClr val="000000">
-                <a:alpha val="100000"/>
-            </a:srgbClr>
-            </a:gs>
-        </a:gsLst>
-        <a:lin ang="10800000" scaled="1"/>
-        </a:gradFill>
-        '''
-        spPr.append(parse_xml(gradient_xml))
+        self._apply_gradient(shape, GRADIENT_TITLE)
    
     def _set_shape_transparency(self, shape, alpha, angle='16200000', trans_angle='16200000'):
         """ Set the transparency (alpha) of a shape with gradient fill from light blue-green to transparent
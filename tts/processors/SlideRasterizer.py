@@ -0,0 +1,229 @@
+import os
+import shutil
+import subprocess
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+from AppConfig import AppConfig
+from processors.BackgroundNormalizer import BackgroundNormalizer
+
+# Output size; the 13.33 x 7.5 inch slide maps to 144 pixels per inch, so 1 pt is 2 px
+WIDTH = 1920
+HEIGHT = 1080
+PX_PER_INCH = 144
+PX_PER_PT = PX_PER_INCH / 72
+
+# Layout of SlideGenerator in pixels
+BAND_HEIGHT = 3 * PX_PER_INCH
+TITLE_TOP = HEIGHT - 4 * PX_PER_INCH
+MARGIN_X = int(0.5 * PX_PER_INCH)
+MARGIN_Y = int(0.2 * PX_PER_INCH)
+LOGO_SIZE = int(1.5 * PX_PER_INCH)
+LOGO_LEFT = int(WIDTH - LOGO_SIZE - 3 * PX_PER_INCH)
+LOGO_TOP = 3 * PX_PER_INCH
+
+# Every text box starts with the empty paragraph left by text_frame.clear(), in the default 18 pt
+EMPTY_PARAGRAPH_PT = 18
+LINE_SPACING = 1.2
+
+# Gradient stop colors of the bands and the title box (see SlideGenerator's gradient fragments)
+OPAQUE_COLOR = np.array([0, 0, 0], dtype=np.float32)
+TRANSPARENT_COLOR = np.array([6, 6, 6], dtype=np.float32)
+
+# Fonts tried when the configured font name cannot be loaded
+FALLBACK_FONTS = ["DejaVuSans.ttf", "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", "Arial.ttf"]
+
+
+class SlideRasterizer:
+    """
+    Draw the slides SlideGenerator lays out straight to 1920x1080 PNG images, without PPTX or LibreOffice.
+
+    The background with its gradient bands is composited once per document as a NumPy
+    array (one per combination of bands) and the logo is resized once; each slide only
+    draws its text and title box on a copy of that base.
+    """
+
+    def __init__(self):
+        self.config = AppConfig()
+        self._bases: Dict[Tuple[Optional[str], bool, bool], np.ndarray] = {}
+        self._fonts: Dict[Tuple[str, int], ImageFont.FreeTypeFont] = {}
+        self._logo: Optional[Image.Image] = None
+        self._logo_loaded = False
+        self.background_normalizer = BackgroundNormalizer() if self.config.slide_background_normalize else None
+
+    def create_slide(self, title: str, content: str, background_image: str, output_file: str, translated_content: Optional[str] = None) -> str:
+        """Render a slide with the given content to a PNG next to output_file and return the PNG path."""
+        show_translation = bool(translated_content) and self.config.activate_translation
+        base = self._get_base(background_image, bool(content), show_translation)
+        image = Image.fromarray(base)
+        draw = ImageDraw.Draw(image)
+
+        content_font = self._font(self.config.slide_content_font_name, self.config.slide_content_font_size)
+        content_color = tuple(self.config.slide_content_font_color)
+        if content:
+            lines = self._wrap(draw, self._split_lines(content), content_font, WIDTH - 2 * MARGIN_X)
+            height = self._text_height(lines, self.config.slide_content_font_size)
+            self._draw_lines(draw, lines, content_font, content_color, HEIGHT - MARGIN_Y - height)
+        if show_translation:
+            lines = self._wrap(draw, self._split_lines(translated_content), content_font, WIDTH - 2 * MARGIN_X)
+            self._draw_lines(draw, lines, content_font, content_color, MARGIN_Y)
+
+        if title and self.config.enable_slide_title:
+            self._draw_title(image, draw, title)
+
+        logo = self._get_logo()
+        if logo is not None:
+            image.paste(logo, (LOGO_LEFT, LOGO_TOP), logo)
+
+        png_file = os.path.splitext(output_file)[0] + ".png"
+        # Fast compression: the PNG is an intermediate read back once by the video encoder
+        image.save(png_file, "PNG", compress_level=1)
+        return png_file
+
+    def _get_base(self, background_image: Optional[str], with_content: bool, with_translation: bool) -> np.ndarray:
+        """Return the background with its gradient bands as a uint8 array, composited once per combination."""
+        if not (background_image and os.path.exists(background_image)):
+            background_image = None
+        key = (background_image, with_content, with_translation)
+        base = self._bases.get(key)
+        if base is not None:
+            return base
+
+        if background_image:
+            if self.background_normalizer is not None:
+                background_image = self.background_normalizer.normalize(background_image)
+            with Image.open(background_image) as background:
+                background = background.convert("RGB")
+                if background.size != (WIDTH, HEIGHT):
+                    background = background.resize((WIDTH, HEIGHT), Image.LANCZOS)
+                pixels = np.asarray(background, dtype=np.float32)
+        else:
+            pixels = np.full((HEIGHT, WIDTH, 3), 255, dtype=np.float32)
+
+        if with_content:
+            # Opaque at the bottom edge, transparent at the top of the band
+            alpha = np.linspace(0.0, 1.0, BAND_HEIGHT, dtype=np.float32)
+            self._blend_rows(pixels, HEIGHT - BAND_HEIGHT, alpha)
+        if with_translation:
+            # Opaque at the top edge, transparent at the bottom of the band
+            alpha = np.linspace(1.0, 0.0, BAND_HEIGHT, dtype=np.float32)
+            self._blend_rows(pixels, 0, alpha)
+
+        base = np.clip(np.rint(pixels), 0, 255).astype(np.uint8)
+        self._bases[key] = base
+        return base
+
+    @staticmethod
+    def _blend_rows(pixels: np.ndarray, top: int, alpha: np.ndarray):
+        """Blend a vertical two-stop gradient band into pixels in place, alpha given per row."""
+        alpha = alpha[:, None, None]
+        color = TRANSPARENT_COLOR + (OPAQUE_COLOR - TRANSPARENT_COLOR) * alpha
+        band = pixels[top:top + len(alpha)]
+        band *= 1.0 - alpha
+        band += color * alpha
+
+    def _draw_title(self, image: Image.Image, draw: ImageDraw.ImageDraw, title: str):
+        """Draw the title box, sized from the text like SlideGenerator, with its left-to-right fade."""
+        font_size = self.config.slide_title_font_size
+        title_lines = title.split("\n")
+        # Same size estimate as SlideGenerator: 0.6 em per character plus margins
+        box_width = int(len(max(title_lines, key=len)) * font_size * 0.6 * PX_PER_PT + PX_PER_INCH)
+        box_height = int(font_size * len(title_lines) * PX_PER_PT + 0.4 * PX_PER_INCH)
+        box_width = min(box_width, WIDTH)
+
+        region = np.asarray(image.crop((0, TITLE_TOP, box_width, TITLE_TOP + box_height)), dtype=np.float32)
+        # Opaque at the left edge, transparent at the right
+        alpha = np.linspace(1.0, 0.0, box_width, dtype=np.float32)[None, :, None]
+        color = TRANSPARENT_COLOR + (OPAQUE_COLOR - TRANSPARENT_COLOR) * alpha
+        region = region * (1.0 - alpha) + color * alpha
+        image.paste(Image.fromarray(np.clip(np.rint(region), 0, 255).astype(np.uint8)), (0, TITLE_TOP))
+
+        # Text is anchored in the middle of the box and may overflow it, as in the PPTX
+        font = self._font(self.config.slide_title_font_name, font_size)
+        lines = [(line, font_size) for line in title_lines]
+        height = self._text_height(lines, font_size)
+        top = TITLE_TOP + (box_height - height) / 2
+        self._draw_lines(draw, lines, font, tuple(self.config.slide_title_font_color), top, align_left=True)
+
+    def _draw_lines(self, draw: ImageDraw.ImageDraw, lines: List[Tuple[str, int]], font, color, top: float, align_left: bool = False):
+        """Draw (text, size in pt) lines from top, after the leading empty paragraph."""
+        y = top + EMPTY_PARAGRAPH_PT * PX_PER_PT * LINE_SPACING
+        for text, size in lines:
+            line_height = size * PX_PER_PT * LINE_SPACING
+            if align_left:
+                x = MARGIN_X
+            else:
+                x = (WIDTH - draw.textlength(text, font=font)) / 2
+            draw.text((x, y + (line_height - size * PX_PER_PT) / 2), text, font=font, fill=color)
+            y += line_height
+
+    @staticmethod
+    def _text_height(lines: List[Tuple[str, int]], font_size: int) -> float:
+        """Return the height of the lines including the leading empty paragraph."""
+        return (EMPTY_PARAGRAPH_PT + font_size * len(lines)) * PX_PER_PT * LINE_SPACING
+
+    def _wrap(self, draw: ImageDraw.ImageDraw, paragraphs: List[str], font, max_width: int) -> List[Tuple[str, int]]:
+        """Word-wrap paragraphs to max_width and return (text, size in pt) lines."""
+        size = self.config.slide_content_font_size
+        lines = []
+        for paragraph in paragraphs:
+            line = ""
+            for word in paragraph.split():
+                candidate = f"{line} {word}" if line else word
+                if line and draw.textlength(candidate, font=font) > max_width:
+                    lines.append((line, size))
+                    line = word
+                else:
+                    line = candidate
+            lines.append((line, size))
+        return lines
+
+    @staticmethod
+    def _split_lines(text: str) -> List[str]:
+        """Split text into its non-empty stripped lines, one paragraph each."""
+        return [line.strip() for line in text.split("\n") if line.strip()]
+
+    def _font(self, name: str, size_pt: int) -> ImageFont.ImageFont:
+        """Load a font by name at a point size, falling back to a common font when it is not installed."""
+        key = (name, size_pt)
+        font = self._fonts.get(key)
+        if font is not None:
+            return font
+
+        size_px = int(round(size_pt * PX_PER_PT))
+        candidates = [self.config.slide_raster_font_file, name, f"{name}.ttf", self._match_font(name)] + FALLBACK_FONTS
+        for candidate in candidates:
+            if not candidate:
+                continue
+            try:
+                font = ImageFont.truetype(candidate, size_px)
+                break
+            except OSError:
+                continue
+        else:
+            print(f"Font {name} not found, using Pillow's default font")
+            font = ImageFont.load_default(size_px)
+        self._fonts[key] = font
+        return font
+
+    @staticmethod
+    def _match_font(name: str) -> Optional[str]:
+        """Resolve a font family name to a file with fontconfig, when available."""
+        if not shutil.which("fc-match"):
+            return None
+        try:
+            result = subprocess.run(["fc-match", "-f", "%{file}", name], capture_output=True, text=True, timeout=5)
+            return result.stdout.strip() or None
+        except (OSError, subprocess.SubprocessError):
+            return None
+
+    def _get_logo(self) -> Optional[Image.Image]:
+        """Return the logo resized to its slide size, loaded once."""
+        if not self._logo_loaded:
+            self._logo_loaded = True
+            if os.path.exists(self.config.slide_logo_file):
+                with Image.open(self.config.slide_logo_file) as logo:
+                    self._logo = logo.convert("RGBA").resize((LOGO_SIZE, LOGO_SIZE), Image.LANCZOS)
+            else:
+                print(f"Logo file not found: {self.config.slide_logo_file}")
+        return self._logo
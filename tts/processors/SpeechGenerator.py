@@ -1,31 +1,47 @@
 # tts/processors/SpeechGenerator.py
 import os
-from mutagen.mp3 import MP3
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+from xml.sax.saxutils import escape
 from AppConfig import AppConfig
-from GoogleTextToSpeech import GoogleTextToSpeech
+from TextToSpeechService import TextToSpeechService, SynthesizedAudio, BatchUnsupportedError
+from audio.AudioInfo import AudioInfo
+from audio.TimeStretcher import TimeStretcher
+from processors.TextChunker import TextChunker
+from metrics.TTSMetrics import TTSMetrics
 #from pydub import AudioSegment
 
+# Bytes of SSML markup around each batched text (<mark name="itemNN"/> and <break time="NNNNms"/>)
+SSML_ITEM_OVERHEAD = 48
+# Bytes of the enclosing <speak></speak> element
+SSML_DOCUMENT_OVERHEAD = 15
+
 class SpeechGenerator:
-    def __init__(self, google_tts: GoogleTextToSpeech):
+    def __init__(self, google_tts: TextToSpeechService):
         self.google_tts = google_tts
         self.config = AppConfig()
+        self.text_chunker = TextChunker(self.config.tts_max_input_bytes)
+        self.metrics = TTSMetrics()
+        # Caps the requests in flight across items and chunks of long items, which run in nested pools
+        self._request_slots = threading.BoundedSemaphore(max(1, self.config.tts_max_concurrency))
 
     def generate_speech(self, sleep: int, text: str, output_file: str, voice_name: str, gender: str, language_code: str, speaking_rate: float = 1.0) -> tuple[str, int]:
         """Generate speech from text and return the file path and duration."""
-        self.google_tts.synthesize_speech(
-            text=text,
-            output_filename=output_file,
-            voice_name=voice_name,
-            gender=gender,
-            language_code=language_code,
-            speaking_rate=speaking_rate
-        )
+        start = time.monotonic()
+        audio = self.synthesize(text, voice_name, gender, language_code, speaking_rate)
+        self.metrics.record_item(time.monotonic() - start)
+        return self._save_speech(audio, output_file, sleep)
+
+    def _save_speech(self, audio: SynthesizedAudio, output_file: str, sleep: int) -> tuple[str, int]:
+        """Write synthesized audio to output_file and return the path with its length including the pause."""
+        audio.save(output_file)
 
-        audio = MP3(output_file)
         if not sleep:
             sleep = 0
-        audio_length = int((audio.info.length + sleep) * 1000)  # Length in milliseconds
-        print(f"Real length: {audio.info.length}, Generated audio length: {audio_length} ms for file: {output_file} and sleep {sleep}")
+        audio_length = int((audio.duration + sleep) * 1000)  # Length in milliseconds
+        print(f"Real length: {audio.duration}, Generated audio length: {audio_length} ms for file: {output_file} and sleep {sleep}")
         # if sleep and sleep > 0:
         #     audio = AudioSegment.from_file(output_file, format="mp3")
         #     silence = AudioSegment.silent(duration=int(sleep * 1000))
@@ -35,4 +51,151 @@ class SpeechGenerator:
         # audio = MP3(output_file)
         # audio_length = int(audio.info.length * 1000)  # Length in milliseconds
         # print(f"Extended audio length: {audio_length} ms for file: {output_file}")
-        return output_file, audio_length
\ No newline at end of file
+        return output_file, audio_length
+
+    def synthesize(self, text: str, voice_name: str, gender: str, language_code: str, speaking_rate: float = 1.0) -> SynthesizedAudio:
+        """
+        Synthesize speech in memory and return the audio bytes with their duration.
+        Callers decide whether and where to persist the audio.
+        """
+        synthesis_rate = self._synthesis_rate(speaking_rate)
+        if self.text_chunker.needs_split(text):
+            audio = self._synthesize_chunked(text, voice_name, gender, language_code, synthesis_rate)
+        else:
+            audio = self._synthesize_audio(
+                text=text,
+                voice_name=voice_name,
+                gender=gender,
+                language_code=language_code,
+                speaking_rate=synthesis_rate
+            )
+        return TimeStretcher.stretch_audio(audio, speaking_rate / synthesis_rate)
+
+    def _synthesis_rate(self, speaking_rate: float) -> float:
+        """Return the rate to request from the TTS service; the base rate when rates are derived locally."""
+        if self.config.tts_time_stretch_enabled:
+            return self.config.tts_time_stretch_base_rate
+        return speaking_rate
+
+    def generate_speech_many(self, speech_requests: List[dict]) -> List[tuple[str, int]]:
+        """
+        Generate speech for many items concurrently.
+
+        Args:
+            speech_requests: List of keyword-argument dicts for generate_speech
+
+        Returns:
+            List of (file path, duration) tuples in the same order as speech_requests
+        """
+        if not speech_requests:
+            return []
+
+        if self.config.tts_ssml_batching:
+            tasks = self._plan_batches(speech_requests)
+        else:
+            tasks = [[index] for index in range(len(speech_requests))]
+
+        def run(task: List[int]) -> List[tuple[str, int]]:
+            if len(task) == 1:
+                return [self.generate_speech(**speech_requests[task[0]])]
+            return self._generate_speech_batch([speech_requests[index] for index in task])
+
+        max_workers = max(1, min(self.config.tts_max_concurrency, len(tasks)))
+        print(f"Generating speech for {len(speech_requests)} items in {len(tasks)} requests with {max_workers} workers")
+        results = [None] * len(speech_requests)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tts") as executor:
+            for task, task_results in zip(tasks, executor.map(run, tasks)):
+                for index, result in zip(task, task_results):
+                    results[index] = result
+        return results
+
+    def _plan_batches(self, speech_requests: List[dict]) -> List[List[int]]:
+        """
+        Group request indices into SSML batches.
+        Short texts with the same voice, language and rate share a batch, bounded by the
+        batch size and by the request byte limit including the SSML markup around each text.
+        Everything else stays a single-item task.
+        """
+        max_items = max(1, self.config.tts_ssml_batch_size)
+        max_bytes = self.config.tts_max_input_bytes - SSML_DOCUMENT_OVERHEAD
+        open_batches = {}
+        tasks = []
+        for index, request in enumerate(speech_requests):
+            text = request["text"]
+            if len(text) > self.config.tts_ssml_batch_max_chars or self.text_chunker.needs_split(text):
+                tasks.append([index])
+                continue
+
+            size = len(escape(text).encode("utf-8")) + SSML_ITEM_OVERHEAD
+            key = (request["voice_name"], request["gender"], request["language_code"], request.get("speaking_rate", 1.0))
+            batch = open_batches.get(key)
+            if batch is None or len(batch["indices"]) >= max_items or batch["bytes"] + size > max_bytes:
+                batch = {"indices": [], "bytes": 0}
+                open_batches[key] = batch
+                tasks.append(batch["indices"])
+            batch["indices"].append(index)
+            batch["bytes"] += size
+        return tasks
+
+    def _generate_speech_batch(self, speech_requests: List[dict]) -> List[tuple[str, int]]:
+        """
+        Synthesize requests sharing a voice in one batch call and save each item to its own file.
+        When the service cannot batch them, each request is generated on its own.
+        """
+        first = speech_requests[0]
+        speaking_rate = first.get("speaking_rate", 1.0)
+        synthesis_rate = self._synthesis_rate(speaking_rate)
+        start = time.monotonic()
+        try:
+            with self._request_slots:
+                audios = self.google_tts.synthesize_batch(
+                    [request["text"] for request in speech_requests],
+                    voice_name=first["voice_name"],
+                    gender=first["gender"],
+                    language_code=first["language_code"],
+                    speaking_rate=synthesis_rate
+                )
+        except BatchUnsupportedError:
+            return [self.generate_speech(**request) for request in speech_requests]
+        audios = [TimeStretcher.stretch_audio(audio, speaking_rate / synthesis_rate) for audio in audios]
+        elapsed = time.monotonic() - start
+        results = []
+        for request, audio in zip(speech_requests, audios):
+            self.metrics.record_item(elapsed)
+            results.append(self._save_speech(audio, request["output_file"], request["sleep"]))
+        return results
+
+    def _synthesize_chunked(self, text: str, voice_name: str, gender: str, language_code: str, speaking_rate: float) -> SynthesizedAudio:
+        """
+        Synthesize a text that is too long for one request.
+        The text is split at sentence boundaries, the chunks are synthesized in parallel
+        and their audio is joined in memory. The duration is the sum of the chunk durations.
+        Chunk requests share the request slots of all items, so the concurrency cap holds.
+        """
+        chunks = self.text_chunker.split(text)
+        print(f"Text of {len(text)} characters split into {len(chunks)} chunks")
+
+        def synthesize_chunk(chunk: str) -> SynthesizedAudio:
+            return self._synthesize_audio(
+                text=chunk,
+                voice_name=voice_name,
+                gender=gender,
+                language_code=language_code,
+                speaking_rate=speaking_rate
+            )
+
+        max_workers = max(1, min(self.config.tts_max_concurrency, len(chunks)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tts-chunk") as executor:
+            parts = list(executor.map(synthesize_chunk, chunks))
+
+        audio_encoding = parts[0].audio_encoding
+        return SynthesizedAudio(
+            AudioInfo.join([part.audio_content for part in parts], audio_encoding),
+            sum(part.duration for part in parts),
+            audio_encoding
+        )
+
+    def _synthesize_audio(self, **kwargs) -> SynthesizedAudio:
+        """Call the TTS service once a request slot is free."""
+        with self._request_slots:
+            return self.google_tts.synthesize_audio(**kwargs)
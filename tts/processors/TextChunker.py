@@ -0,0 +1,75 @@
+import re
+from typing import List
+
+# Sentence ends followed by whitespace, and paragraph breaks
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?。！？])\s+|\n\s*\n")
+# Softer boundaries used when a single sentence is too long
+CLAUSE_BOUNDARY = re.compile(r"(?<=[,;:])\s+")
+
+
+class TextChunker:
+    """Split long texts into chunks that fit in a single TTS request."""
+
+    def __init__(self, max_bytes: int):
+        """
+        Args:
+            max_bytes: Maximum UTF-8 size of a chunk in bytes
+        """
+        self.max_bytes = max_bytes
+
+    def needs_split(self, text: str) -> bool:
+        """Return True if the text is too long for a single request."""
+        return self._size(text) > self.max_bytes
+
+    def split(self, text: str) -> List[str]:
+        """
+        Split text at sentence boundaries, packing consecutive sentences into chunks
+        of at most max_bytes. Sentences that are too long on their own are split at
+        clause boundaries, then at word boundaries.
+        """
+        pieces = []
+        for sentence in SENTENCE_BOUNDARY.split(text):
+            sentence = sentence.strip()
+            if sentence:
+                pieces.extend(self._split_long(sentence))
+        return self._pack(pieces)
+
+    def _split_long(self, sentence: str) -> List[str]:
+        """Break a single oversized sentence into pieces that each fit."""
+        if self._size(sentence) <= self.max_bytes:
+            return [sentence]
+
+        pieces = []
+        for clause in CLAUSE_BOUNDARY.split(sentence):
+            if self._size(clause) <= self.max_bytes:
+                pieces.append(clause)
+                continue
+            # Fall back to word boundaries, and to a hard cut for a single giant word
+            for word in clause.split():
+                while self._size(word) > self.max_bytes:
+                    head = word.encode("utf-8")[:self.max_bytes].decode("utf-8", errors="ignore")
+                    pieces.append(head)
+                    word = word[len(head):]
+                pieces.append(word)
+        return self._pack(pieces)
+
+    def _pack(self, pieces: List[str]) -> List[str]:
+        """Greedily join consecutive pieces with spaces while they fit in max_bytes."""
+        chunks = []
+        current = ""
+        for piece in pieces:
+            candidate = f"{current} {piece}" if current else piece
+            if self._size(candidate) <= self.max_bytes:
+                current = candidate
+            else:
+                if current:
+                    chunks.append(current)
+                current = piece
+        if current:
+            chunks.append(current)
+        return chunks
+
+    @staticmethod
+    def _size(text: str) -> int:
+        """Return the UTF-8 size of text in bytes."""
+        return len(text.encode("utf-8"))
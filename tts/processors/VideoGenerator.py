@@ -1,24 +1,48 @@
 import os
+import json
+import queue
+import shutil
+import tempfile
 import subprocess
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 from pdf2image import convert_from_path
+from pdf2image.exceptions import PDFInfoNotInstalledError, PDFPageCountError, PDFPopplerTimeoutError, PDFSyntaxError
+from PIL import Image
 from moviepy import *
 from AppConfig import AppConfig
+from processors.OfficeConverter import OfficeConverter
+
+# Size of the slide images in the videos
+VIDEO_SIZE = (1920, 1080)
+
+# Stream parameters that must match for videos to be concatenated without re-encoding
+VIDEO_STREAM_FIELDS = ("codec_name", "profile", "width", "height", "pix_fmt", "sample_aspect_ratio", "r_frame_rate")
+AUDIO_STREAM_FIELDS = ("codec_name", "profile", "sample_rate", "channels", "sample_fmt")
+
 
 class VideoGenerator:
     def __init__(self):
         self.config = AppConfig()
+        self.office_converter = OfficeConverter() if self.config.libreoffice_persistent else None
 
     def create_video(self, slide_file: str, audio_file: str, audio_length: int, output_file: str) -> str:
         """Create a video from slide and audio."""
-        slide_image_file = self._convert_slide_to_image(slide_file)
+        slide_image_file = self.convert_slide_to_image(slide_file)
         if not slide_image_file:
             return None
 
+        if self.config.still_image_encoding and shutil.which(self.config.ffmpeg_binary):
+            if self._encode_still_image(slide_image_file, audio_file, audio_length, output_file):
+                return output_file
+            print(f"Still-image encoding of {output_file} failed, encoding with moviepy")
+
         # Create video clip
         image_clip = ImageClip(
             img=slide_image_file, 
             duration=(audio_length / 1000) + 1
-        ).resized((1920, 1080))
+        ).resized(VIDEO_SIZE)
         
         # Generate video with audio
         image_clip.write_videofile(
@@ -31,60 +55,267 @@ class VideoGenerator:
 
         return output_file
 
-    def _convert_slide_to_image(self, slide_file: str) -> str:
+    def _encode_still_image(self, image_file: str, audio_file: str, audio_length: int, output_file: str) -> bool:
+        """
+        Encode a still slide with its audio in one ffmpeg run: the image is decoded, scaled and
+        converted to YUV once, then repeated in memory by the loop filter at STILL_IMAGE_FPS
+        (the image demuxer's -loop 1 would decode the PNG again for every frame). x264 is tuned
+        for still images with a long GOP, and the audio is muxed directly, padded with silence
+        to the segment length. Returns False when ffmpeg failed.
+        """
+        fps = self.config.still_image_fps
+        command = [
+            self.config.ffmpeg_binary, "-y", "-loglevel", "error",
+            "-framerate", str(fps), "-i", image_file,
+            "-i", audio_file,
+            "-map", "0:v", "-map", "1:a",
+            "-vf", f"scale={VIDEO_SIZE[0]}:{VIDEO_SIZE[1]},format=yuv420p,loop=loop=-1:size=1:start=0",
+            "-c:v", self.config.image_to_video_codec,
+        ]
+        if self.config.image_to_video_codec == "libx264":
+            command += ["-tune", "stillimage", "-preset", self.config.still_image_preset]
+        command += [
+            "-g", str(max(1, int(fps * self.config.still_image_gop_seconds))),
+            "-r", str(fps),
+            "-c:a", self.config.text_to_audio_codec,
+            "-af", "apad",
+            # Same length as the moviepy clip: the audio plus one second
+            "-t", f"{(audio_length / 1000) + 1:.3f}",
+            output_file,
+        ]
+        try:
+            subprocess.run(command, check=True, capture_output=True, timeout=self.config.ffmpeg_timeout)
+            return os.path.exists(output_file)
+        except subprocess.CalledProcessError as e:
+            print(f"Error encoding {output_file} with ffmpeg: {e.stderr.decode(errors='replace').strip()}")
+        except (subprocess.TimeoutExpired, OSError) as e:
+            print(f"Error encoding {output_file} with ffmpeg: {e}")
+        return False
+
+    def concat_videos(self, video_files: List[str], output_file: str, audio_codec: str) -> bool:
+        """
+        Concatenate videos with the ffmpeg concat demuxer, copying the video stream and the
+        audio stream when it is already in audio_codec (otherwise only the audio is encoded,
+        e.g. PCM segments into an AAC output). Only done when every video has the same stream
+        parameters; returns False, without output, when they differ or ffmpeg failed, so the
+        caller can fall back to re-encoding.
+        """
+        if not (self.config.merge_stream_copy and shutil.which(self.config.ffmpeg_binary) and shutil.which(self.config.ffprobe_binary)):
+            return False
+
+        signatures = set()
+        for video_file in video_files:
+            signature = self._stream_signature(video_file)
+            if signature is None:
+                return False
+            signatures.add(signature)
+        if len(signatures) != 1:
+            print(f"Videos for {output_file} differ in stream parameters, re-encoding instead of copying")
+            return False
+        input_audio_codec = next(iter(signatures))[1][0]
+
+        fd, list_file = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(output_file)), suffix=".txt")
+        try:
+            with os.fdopen(fd, "w") as f:
+                for video_file in video_files:
+                    escaped_path = os.path.abspath(video_file).replace("'", "'\\''")
+                    f.write(f"file '{escaped_path}'\n")
+
+            command = [
+                self.config.ffmpeg_binary, "-y", "-loglevel", "error",
+                "-f", "concat", "-safe", "0", "-i", list_file,
+                "-map", "0:v:0", "-map", "0:a:0",
+                "-c:v", "copy",
+                "-c:a", "copy" if input_audio_codec == audio_codec else audio_codec,
+            ]
+            if output_file.lower().endswith(".mp4"):
+                command += ["-movflags", "+faststart"]
+            subprocess.run(command + [output_file], check=True, capture_output=True, timeout=self.config.ffmpeg_timeout)
+            print(f"Concatenated {len(video_files)} videos into {output_file} without re-encoding video")
+            return True
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as e:
+            stderr = getattr(e, "stderr", None)
+            print(f"Error concatenating videos into {output_file}: {stderr.decode(errors='replace').strip() if stderr else e}")
+            if os.path.exists(output_file):
+                os.remove(output_file)
+            return False
+        finally:
+            os.remove(list_file)
+
+    def _stream_signature(self, video_file: str) -> Optional[Tuple[tuple, tuple]]:
+        """Return the (video, audio) stream parameters of a video with ffprobe, or None when it cannot be probed."""
+        try:
+            result = subprocess.run([
+                self.config.ffprobe_binary, "-v", "error",
+                "-show_entries", "stream=codec_type," + ",".join(sorted(set(VIDEO_STREAM_FIELDS + AUDIO_STREAM_FIELDS))),
+                "-of", "json", video_file,
+            ], check=True, capture_output=True, text=True, timeout=60)
+            streams = json.loads(result.stdout).get("streams", [])
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError, ValueError) as e:
+            print(f"Error probing {video_file}: {e}")
+            return None
+
+        video_streams = [stream for stream in streams if stream.get("codec_type") == "video"]
+        audio_streams = [stream for stream in streams if stream.get("codec_type") == "audio"]
+        if len(video_streams) != 1 or len(audio_streams) != 1:
+            return None
+        return (
+            tuple(video_streams[0].get(field) for field in VIDEO_STREAM_FIELDS),
+            tuple(audio_streams[0].get(field) for field in AUDIO_STREAM_FIELDS),
+        )
+
+    def convert_deck_to_images(self, deck_file: str, slide_count: int) -> Optional[List[str]]:
+        """
+        Convert a multi-slide deck to one PNG per slide, in slide order, with a single PDF
+        export and a single pdftoppm pass. Returns None when the conversion fails.
+        """
+        output_dir = os.path.abspath(os.path.dirname(deck_file))
+        base_name = os.path.splitext(os.path.basename(deck_file))[0]
+
+        pdf_file = self._convert_with_office(deck_file, "pdf", output_dir)
+        if not pdf_file:
+            return None
+
+        try:
+            # Pages are written straight to disk, so memory stays at one page whatever the deck size
+            png_files = convert_from_path(
+                pdf_file,
+                size=self._raster_size(),
+                output_folder=output_dir,
+                fmt="png",
+                output_file=base_name,
+                paths_only=True
+            )
+            if len(png_files) != slide_count:
+                print(f"Deck {deck_file} rendered {len(png_files)} pages for {slide_count} slides")
+                return None
+            if self.config.slide_raster_supersample > 1:
+                for png_file in png_files:
+                    with Image.open(png_file) as image:
+                        image = image.resize(VIDEO_SIZE, Image.LANCZOS)
+                    image.save(png_file, "PNG")
+            return png_files
+        except (PDFInfoNotInstalledError, PDFPageCountError, PDFSyntaxError, PDFPopplerTimeoutError, OSError) as e:
+            print(f"Error rasterizing deck {pdf_file}: {e}")
+            return None
+
+    def convert_slide_to_image(self, slide_file: str) -> str:
         """Convert slide to image using either PDF or direct PNG conversion."""
-        slide_image_dir = os.path.abspath(os.path.dirname(slide_file))
-        base_name = os.path.splitext(os.path.basename(slide_file))[0]
+        if slide_file.lower().endswith(".png"):
+            # Already rasterized by SlideRasterizer
+            return slide_file
 
-        if self.config.slide_generation_mode_pdf:
-            return self._convert_via_pdf(slide_file, slide_image_dir, base_name)
-        else:
-            return self._convert_to_png(slide_file, slide_image_dir, base_name)
+        return self._convert_slide(slide_file, os.path.abspath(os.path.dirname(slide_file)))
+
+    def convert_slides_to_images(self, slide_files: List[str]) -> List[Optional[str]]:
+        """
+        Convert slides to images, in order, with up to SLIDE_CONVERSION_WORKERS one-shot
+        LibreOffice runs at once. Each worker has its own LibreOffice profile and output
+        directory, since concurrent soffice runs sharing a profile block or fail; the images
+        are then moved next to their slides. Failed conversions are None.
+        """
+        workers = min(self.config.slide_conversion_workers, len(slide_files))
+        if workers <= 1 or all(slide_file.lower().endswith(".png") for slide_file in slide_files):
+            return [self.convert_slide_to_image(slide_file) for slide_file in slide_files]
+
+        # Worker directories are per process, so several generators can run side by side
+        pool_dir = os.path.join(self.config.temp_dir, "libreoffice_workers", str(os.getpid()))
+        worker_dirs = queue.Queue()
+        for index in range(workers):
+            worker_dirs.put(os.path.join(pool_dir, str(index)))
+
+        def convert(slide_file: str) -> Optional[str]:
+            if slide_file.lower().endswith(".png"):
+                return slide_file
+            worker_dir = worker_dirs.get()
+            try:
+                return self._convert_in_worker(slide_file, worker_dir)
+            finally:
+                worker_dirs.put(worker_dir)
 
-    def _convert_via_pdf(self, slide_file: str, output_dir: str, base_name: str) -> str:
-        """Convert slide to image via PDF intermediate step."""
         try:
-            # Convert to PDF
-            subprocess.run([
-                "soffice",
-                "--headless",
-                "--convert-to",
-                "pdf",
-                "--outdir",
-                output_dir,
-                slide_file,
-            ], check=True)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(convert, slide_files))
+        finally:
+            shutil.rmtree(pool_dir, ignore_errors=True)
 
-            pdf_file = os.path.join(output_dir, f"{base_name}.pdf")
-            if not os.path.exists(pdf_file):
+    def _convert_in_worker(self, slide_file: str, worker_dir: str) -> Optional[str]:
+        """Convert a slide with a worker's own profile and output directory, then move the image next to the slide."""
+        output_dir = os.path.join(worker_dir, "output")
+        os.makedirs(output_dir, exist_ok=True)
+        try:
+            image_file = self._convert_slide(slide_file, output_dir, profile_dir=os.path.join(worker_dir, "profile"))
+            if not image_file:
                 return None
+            target_file = os.path.join(os.path.abspath(os.path.dirname(slide_file)), os.path.basename(image_file))
+            shutil.move(image_file, target_file)
+            return target_file
+        finally:
+            # Drop intermediates such as the PDF, keeping the profile warm for the next slide
+            for name in os.listdir(output_dir):
+                os.remove(os.path.join(output_dir, name))
 
-            # Convert PDF to PNG
-            png_file = os.path.join(output_dir, f"{base_name}.png")
-            images = convert_from_path(pdf_file, dpi=900)
-            images[0].save(png_file, 'PNG')
-            return png_file
+    def _convert_slide(self, slide_file: str, output_dir: str, profile_dir: Optional[str] = None) -> str:
+        """Convert a slide to a PNG in output_dir, via PDF or directly."""
+        base_name = os.path.splitext(os.path.basename(slide_file))[0]
 
-        except subprocess.CalledProcessError as e:
-            print(f"Error converting slide to PDF: {e}")
+        if self.config.slide_generation_mode_pdf:
+            return self._convert_via_pdf(slide_file, output_dir, base_name, profile_dir)
+        else:
+            return self._convert_to_png(slide_file, output_dir, base_name, profile_dir)
+
+    def _convert_via_pdf(self, slide_file: str, output_dir: str, base_name: str, profile_dir: Optional[str] = None) -> str:
+        """Convert slide to image via PDF intermediate step."""
+        # Convert to PDF
+        pdf_file = self._convert_with_office(slide_file, "pdf", output_dir, profile_dir)
+        if not pdf_file:
             return None
 
-    def _convert_to_png(self, slide_file: str, output_dir: str, base_name: str) -> str:
+        # Convert PDF to PNG, rendering only the first page straight at the target size
+        png_file = os.path.join(output_dir, f"{base_name}.png")
+        images = convert_from_path(pdf_file, size=self._raster_size(), first_page=1, last_page=1)
+        image = images[0]
+        if image.size != VIDEO_SIZE:
+            image = image.resize(VIDEO_SIZE, Image.LANCZOS)
+        image.save(png_file, 'PNG')
+        return png_file
+
+    def _raster_size(self) -> tuple:
+        """Return the pixel size PDF pages are rasterized at: the video size times the supersample factor."""
+        supersample = self.config.slide_raster_supersample
+        return VIDEO_SIZE[0] * supersample, VIDEO_SIZE[1] * supersample
+
+    def _convert_to_png(self, slide_file: str, output_dir: str, base_name: str, profile_dir: Optional[str] = None) -> str:
         """Convert slide directly to PNG."""
+        return self._convert_with_office(slide_file, "png", output_dir, profile_dir)
+
+    def _convert_with_office(self, slide_file: str, target_format: str, output_dir: str, profile_dir: Optional[str] = None) -> str:
+        """
+        Convert a slide with LibreOffice, preferring the persistent office and falling back
+        to a one-shot soffice run when it is unavailable, timed out or failed.
+        With a profile_dir, the slide is always converted by a one-shot run using that profile.
+        """
+        if self.office_converter is not None and profile_dir is None:
+            converted_file = self.office_converter.convert(slide_file, target_format, output_dir)
+            if converted_file:
+                return converted_file
+
+        command = [self.config.libreoffice_binary, "--headless"]
+        if profile_dir:
+            command.append(f"-env:UserInstallation={Path(os.path.abspath(profile_dir)).as_uri()}")
         try:
-            subprocess.run([
-                "soffice",
-                "--headless",
+            subprocess.run(command + [
                 "--convert-to",
-                "png",
+                target_format,
                 "--outdir",
                 output_dir,
                 slide_file,
-            ], check=True)
+            ], check=True, timeout=self.config.libreoffice_convert_timeout * 2)
 
-            png_file = os.path.join(output_dir, f"{base_name}.png")
-            return png_file if os.path.exists(png_file) else None
+            base_name = os.path.splitext(os.path.basename(slide_file))[0]
+            converted_file = os.path.join(output_dir, f"{base_name}.{target_format}")
+            return converted_file if os.path.exists(converted_file) else None
 
-        except subprocess.CalledProcessError as e:
-            print(f"Error converting slide to PNG: {e}")
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            print(f"Error converting slide to {target_format.upper()}: {e}")
             return None
@@ -0,0 +1,42 @@
+import os
+import json
+import time
+import fcntl
+from ratelimit.TokenBucket import TokenBucket
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    Token bucket shared by every process on a host through a lock-protected state file.
+
+    The bucket refills at rate_per_minute up to burst tokens. Each acquire takes one
+    token under an exclusive flock, so concurrent processes together never exceed the
+    rate; callers that find the bucket empty sleep until the next token is due.
+    """
+
+    def __init__(self, state_file: str, rate_per_minute: float, burst: int):
+        super().__init__(rate_per_minute, burst)
+        self.state_file = state_file
+        os.makedirs(os.path.dirname(os.path.abspath(state_file)), exist_ok=True)
+
+    def _try_acquire(self) -> float:
+        """Take a token if one is available; otherwise return the seconds until the next one."""
+        with open(self.state_file, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = json.loads(f.read() or "{}")
+                except ValueError:
+                    state = {}
+
+                now = time.time()
+                tokens, wait = self._take(state.get("tokens", float(self.burst)), state.get("updated", now), now)
+
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps({"tokens": tokens, "updated": now}))
+                f.flush()
+                return wait
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
@@ -0,0 +1,105 @@
+import time
+import threading
+from typing import Optional
+from pymongo import MongoClient
+from pymongo.errors import DuplicateKeyError, PyMongoError
+from AppConfig import AppConfig
+from ratelimit.TokenBucket import TokenBucket
+
+# Same server as MongoDBConnection.connect
+MONGODB_CONNECTION_STRING = "mongodb://localhost:27017/"
+
+# Collection holding one token bucket document per limiter name
+RATE_LIMIT_COLLECTION = "tts_rate_limits"
+
+# Seconds requests pass unthrottled after a MongoDB failure before the bucket is tried again
+OUTAGE_RETRY_INTERVAL = 30.0
+
+
+class MongoTokenBucket(TokenBucket):
+    """
+    Token bucket shared by every render host through a MongoDB document.
+
+    The bucket state (tokens and last refill time) is updated with compare-and-set on a
+    version counter, so hosts racing for the same token retry instead of overdrawing.
+    When MongoDB is unreachable the bucket fails open: requests pass with a warning and
+    one thread probes MongoDB again every OUTAGE_RETRY_INTERVAL, so an outage never stops
+    renders. The bucket uses its own client with a short server selection timeout.
+    """
+
+    def __init__(self, name: str, rate_per_minute: float, burst: int):
+        super().__init__(rate_per_minute, burst)
+        self.name = name
+        self.config = AppConfig()
+        self._lock = threading.Lock()
+        self._client: Optional[MongoClient] = None
+        self._outage = False
+        self._retry_at = 0.0
+
+    def _try_acquire(self) -> float:
+        """Take a token if one is available; otherwise return the seconds until the next one."""
+        with self._lock:
+            probing = self._outage
+            if probing:
+                if time.monotonic() < self._retry_at:
+                    return 0.0
+                # This thread probes MongoDB, the others keep passing until the next interval
+                self._retry_at = time.monotonic() + OUTAGE_RETRY_INTERVAL
+
+        try:
+            wait = self._try_acquire_shared()
+        except PyMongoError as e:
+            with self._lock:
+                self._outage = True
+                self._retry_at = time.monotonic() + OUTAGE_RETRY_INTERVAL
+                self._reset_client()
+            print(f"TTS rate limit: MongoDB unavailable, not throttling for {OUTAGE_RETRY_INTERVAL:.0f}s: {e}")
+            return 0.0
+
+        if probing:
+            with self._lock:
+                self._outage = False
+            print("TTS rate limit: MongoDB available again, throttling resumed")
+        return wait
+
+    def _try_acquire_shared(self) -> float:
+        """Take a token from the shared bucket document, raising PyMongoError when MongoDB fails."""
+        collection = self._collection()
+        while True:
+            now = time.time()
+            state = collection.find_one({"_id": self.name})
+            if state is None:
+                try:
+                    collection.insert_one({"_id": self.name, "tokens": self.burst - 1.0, "updated": now, "version": 0})
+                    return 0.0
+                except DuplicateKeyError:
+                    continue
+
+            tokens, wait = self._take(state["tokens"], state["updated"], now)
+
+            result = collection.update_one(
+                {"_id": self.name, "version": state["version"]},
+                {"$set": {"tokens": tokens, "updated": now, "version": state["version"] + 1}}
+            )
+            if result.modified_count == 1:
+                return wait
+            # Another host updated the bucket first, re-read and try again
+
+    def _collection(self):
+        """Return the rate limit collection, connecting when needed."""
+        with self._lock:
+            if self._client is None:
+                self._client = MongoClient(
+                    MONGODB_CONNECTION_STRING,
+                    serverSelectionTimeoutMS=self.config.tts_rate_limit_mongodb_timeout_ms
+                )
+            return self._client[self.config.database_name][RATE_LIMIT_COLLECTION]
+
+    def _reset_client(self):
+        """Close the client after a failure so the next probe reconnects. Caller must hold the lock."""
+        if self._client is not None:
+            try:
+                self._client.close()
+            except PyMongoError:
+                pass
+            self._client = None
@@ -0,0 +1,40 @@
+import time
+import random
+from abc import ABC, abstractmethod
+from typing import Tuple
+
+
+class TokenBucket(ABC):
+    """
+    Token bucket refilling at rate_per_minute up to burst tokens, with its state kept in shared storage.
+
+    Subclasses implement _try_acquire against their storage; acquire waits for a token.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int):
+        self.rate = rate_per_minute / 60.0
+        self.burst = max(1, burst)
+
+    def acquire(self) -> float:
+        """Take one token, blocking until one is available, and return the seconds waited."""
+        waited = 0.0
+        while True:
+            wait = self._try_acquire()
+            if wait <= 0:
+                return waited
+            # A little jitter keeps waiting processes from waking up in lockstep
+            wait += random.uniform(0, 0.05)
+            time.sleep(wait)
+            waited += wait
+
+    @abstractmethod
+    def _try_acquire(self) -> float:
+        """Take a token if one is available; otherwise return the seconds until the next one."""
+        pass
+
+    def _take(self, tokens: float, updated: float, now: float) -> Tuple[float, float]:
+        """Refill a stored token count up to now and take one token; return (tokens left, seconds to wait)."""
+        tokens = min(float(self.burst), tokens + max(0.0, now - updated) * self.rate)
+        if tokens >= 1.0:
+            return tokens - 1.0, 0.0
+        return tokens, (1.0 - tokens) / self.rate
@@ -0,0 +1,59 @@
+import os
+import sys
+import shutil
+import resource
+
+import pytest
+
+# Modules import each other flat, as when running from the tts directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("dotenv")
+pytest.importorskip("moviepy")
+pytest.importorskip("pdf2image")
+from PIL import Image
+
+# Slide size in inches, as built by SlideGenerator
+SLIDE_INCHES = (13.33, 7.5)
+
+# Rasterizing at 900 DPI took about 240 MB for the page alone; at the video size it is about 6 MB
+MAX_PEAK_RSS_GROWTH_MB = 100
+
+
+def _peak_rss_mb(who) -> float:
+    """Return the peak resident set size in MB (ru_maxrss is in KB on Linux)."""
+    return resource.getrusage(who).ru_maxrss / 1024
+
+
+@pytest.mark.skipif(shutil.which("pdftoppm") is None, reason="poppler (pdftoppm) is not installed")
+def test_slide_pdf_rasterizes_at_video_size_with_bounded_memory(tmp_path, monkeypatch):
+    import processors.VideoGenerator as video_generator_module
+    from processors.VideoGenerator import VideoGenerator, VIDEO_SIZE
+
+    # One-page 13.33 x 7.5 in PDF, standing in for the LibreOffice export of a slide
+    pdf_file = tmp_path / "slide.pdf"
+    page_size = (round(SLIDE_INCHES[0] * 100), round(SLIDE_INCHES[1] * 100))
+    Image.new("RGB", page_size, (30, 60, 90)).save(pdf_file, "PDF", resolution=100)
+
+    generator = VideoGenerator()
+    monkeypatch.setattr(generator.config, "slide_raster_supersample", 1)
+    monkeypatch.setattr(generator, "_convert_with_office", lambda *args, **kwargs: str(pdf_file))
+
+    # pdftoppm runs as a child process; the size it is asked to render bounds its memory
+    raster_sizes = []
+    convert_from_path = video_generator_module.convert_from_path
+
+    def recording_convert_from_path(*args, **kwargs):
+        raster_sizes.append(kwargs.get("size"))
+        return convert_from_path(*args, **kwargs)
+
+    monkeypatch.setattr(video_generator_module, "convert_from_path", recording_convert_from_path)
+
+    baseline = _peak_rss_mb(resource.RUSAGE_SELF)
+    png_file = generator._convert_via_pdf(str(tmp_path / "slide.pptx"), str(tmp_path), "slide")
+    growth = _peak_rss_mb(resource.RUSAGE_SELF) - baseline
+
+    assert raster_sizes == [VIDEO_SIZE]
+    with Image.open(png_file) as image:
+        assert image.size == VIDEO_SIZE
+    assert growth < MAX_PEAK_RSS_GROWTH_MB, f"peak RSS grew by {growth:.0f} MB for one slide"